@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import re
 from collections import defaultdict
 from contextlib import contextmanager
@@ -30,6 +31,26 @@ _TABLE_NAME_COL = "TABLE_NAME"
 _COLUMN_COMMENT_ALIAS = "COLUMN_COMMENT"
 _TABLE_COMMENT_COL = "TABLE_COMMENT"
 _IS_PRIMARY_KEY_COL = "IS_PRIMARY_KEY"
+_SHOW_COLUMNS_MAX_WORKERS = 8
+
+_SHOW_COLUMNS_TEMPLATE = "SHOW COLUMNS IN {identifier}"
+_DESCRIBE_TABLE_TEMPLATE = "DESCRIBE TABLE {identifier}"
+# Column aliases are bound once at import; only the WHERE clause varies per call.
+_INFORMATION_SCHEMA_TEMPLATE = f"""
+SELECT
+    t.table_schema AS {_TABLE_SCHEMA_COL},
+    t.table_name AS {_TABLE_NAME_COL},
+    c.column_name AS {_COLUMN_NAME_COL},
+    c.data_type AS {_DATATYPE_COL},
+    c.comment AS {_COLUMN_COMMENT_ALIAS},
+    t.comment AS {_TABLE_COMMENT_COL},
+    c.is_primary_key AS {_IS_PRIMARY_KEY_COL}
+FROM information_schema.tables t
+JOIN information_schema.columns c
+  ON t.table_schema = c.table_schema
+ AND t.table_name = c.table_name
+WHERE {{where_clause}}
+"""
 
 TIME_MEASURE_DATATYPES = [
     "DATE",
@@ -107,6 +128,50 @@ def _execute_query_to_pandas(connection: Any, query: str) -> pd.DataFrame:
     return df
 
 
+def _row_column_names(record: Any) -> Optional[List[str]]:
+    """Column names from a result row's public ``as_dict``/``asDict`` API."""
+    as_dict = getattr(record, "as_dict", None) or getattr(record, "asDict", None)
+    if as_dict is None:
+        return None
+    try:
+        return list(as_dict())
+    except Exception:  # rows built from bare values have no field names
+        return None
+
+
+def _execute_query_to_rows(
+    connection: Any, query: str
+) -> Tuple[List[str], List[tuple[Any, ...]]]:
+    """
+    Executes a SQL query and returns ``(column_names, rows)`` without building a
+    DataFrame. Intended for small metadata results such as SHOW listings.
+    """
+
+    logger.debug(f"Executing query: {query}")
+
+    if hasattr(connection, "sql"):
+        result = connection.sql(query)
+        records = result.collect()
+        columns = _row_column_names(records[0]) if records else None
+        if columns is None:
+            # Empty results and plain tuples carry no names; ask the result schema.
+            try:
+                columns = list(result.schema.names)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.debug("Could not read result schema for {}: {}", query, exc)
+                columns = []
+        return columns, [tuple(record) for record in records]
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query)
+        columns = [col[0] for col in cursor.description or []]
+        rows = [tuple(row) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+    return columns, rows
+
+
 class ClickzettaCursor:
     def __init__(self, session: Session):
         self._session = session
@@ -434,25 +499,42 @@ def get_table_representation(
     )
 
 
-_CATALOG_CATEGORY_CACHE: Dict[str, str] = {}
-
-
 def _catalog_category(session: Session, workspace: str) -> str:
+    """
+    Returns the catalog category (e.g. ``SHARED``) for a workspace.
+
+    Results are memoized per workspace, independent of the session, so repeated
+    metadata scans issue one ``SHOW CATALOGS`` probe per workspace and no session
+    is kept alive by the cache; call ``_clear_catalog_category_cache()`` to reset.
+    """
     workspace_upper = workspace.upper()
     if not workspace_upper:
         return "UNKNOWN"
-    cached = _CATALOG_CATEGORY_CACHE.get(workspace_upper)
-    if cached:
-        return cached
+    slot = _catalog_category_slot(workspace_upper)
+    if "category" not in slot:
+        slot["category"] = _lookup_catalog_category(session, workspace_upper)
+    return slot["category"]
+
+
+@functools.lru_cache(maxsize=128)
+def _catalog_category_slot(workspace_upper: str) -> Dict[str, str]:
+    """Per-workspace holder for the category; the LRU bounds the workspaces kept."""
+    return {}
+
+
+def _clear_catalog_category_cache() -> None:
+    _catalog_category_slot.cache_clear()
+
+
+def _lookup_catalog_category(session: Session, workspace_upper: str) -> str:
+    """Runs ``SHOW CATALOGS`` and returns the category of ``workspace_upper``."""
     try:
         df = session.sql("SHOW CATALOGS").to_pandas()
     except Exception as exc:  # pragma: no cover
         logger.debug("SHOW CATALOGS failed: {}", exc)
-        _CATALOG_CATEGORY_CACHE[workspace_upper] = "UNKNOWN"
         return "UNKNOWN"
 
     if df.empty:
-        _CATALOG_CATEGORY_CACHE[workspace_upper] = "UNKNOWN"
         return "UNKNOWN"
 
     df.columns = [str(col).upper() for col in df.columns]
@@ -466,17 +548,13 @@ def _catalog_category(session: Session, workspace: str) -> str:
     )
     category_col = next((col for col in ("CATEGORY",) if col in df.columns), None)
     if not name_col or not category_col:
-        _CATALOG_CATEGORY_CACHE[workspace_upper] = "UNKNOWN"
         return "UNKNOWN"
 
     for _, row in df.iterrows():
         name = str(row[name_col]).upper()
         if name == workspace_upper:
-            category = str(row[category_col]).upper()
-            _CATALOG_CATEGORY_CACHE[workspace_upper] = category
-            return category
+            return str(row[category_col]).upper()
 
-    _CATALOG_CATEGORY_CACHE[workspace_upper] = "UNKNOWN"
     return "UNKNOWN"
 
 
@@ -547,40 +625,64 @@ ORDER BY kc.ordinal_position
     return None
 
 
+def _table_filter_pairs(
+    table_schema: Optional[str],
+    table_names: Optional[List[str]],
+) -> List[Tuple[str, str]]:
+    """
+    Returns de-duplicated, upper-cased (schema, table) pairs for the requested
+    tables. Qualified names keep their own schema; bare names use ``table_schema``.
+    """
+
+    return list(_table_filter_pairs_by_name(table_schema, table_names))
+
+
+def _table_filter_pairs_by_name(
+    table_schema: Optional[str],
+    table_names: Optional[List[str]],
+) -> Dict[Tuple[str, str], str]:
+    """Maps each requested (schema, table) pair to the first name requesting it."""
+
+    default_schema = (table_schema or "").upper()
+    pairs: Dict[Tuple[str, str], str] = {}
+    for name in table_names or []:
+        _, schema_only, table_only = _split_identifier(name)
+        if table_only:
+            schema_key = (schema_only or "").upper() or default_schema
+            pairs.setdefault((schema_key, table_only.upper()), name)
+    return pairs
+
+
 def _build_information_schema_query(
     workspace: str,
     table_schema: Optional[str],
     table_names: Optional[List[str]],
 ) -> str:
     where_conditions: List[str] = ["1=1"]
-    if table_schema:
-        where_conditions.append(f"upper(t.table_schema) = '{table_schema.upper()}'")
-    if table_names:
-        normalized_names: List[str] = []
-        for name in table_names:
-            _, _, table_only = _split_identifier(name)
-            if table_only:
-                normalized_names.append(table_only.upper())
-        if normalized_names:
-            formatted_names = ", ".join(f"'{name}'" for name in normalized_names)
+    pairs = _table_filter_pairs(table_schema, table_names)
+    schemas = {schema for schema, _ in pairs if schema}
+    if len(schemas) > 1:
+        # Tables span several schemas: match each (schema, table) pair so one
+        # round-trip covers every requested table.
+        pair_conditions = [
+            f"(upper(t.table_schema) = '{schema}' AND upper(t.table_name) = '{table}')"
+            if schema
+            else f"upper(t.table_name) = '{table}'"
+            for schema, table in pairs
+        ]
+        where_conditions.append(f"({' OR '.join(pair_conditions)})")
+    else:
+        schema_filter = next(iter(schemas), None) or table_schema
+        if schema_filter:
+            where_conditions.append(
+                f"upper(t.table_schema) = '{schema_filter.upper()}'"
+            )
+        if pairs:
+            formatted_names = ", ".join(f"'{table}'" for _, table in pairs)
             where_conditions.append(f"upper(t.table_name) IN ({formatted_names})")
 
     where_clause = " AND ".join(where_conditions)
-    return f"""
-SELECT
-    t.table_schema AS {_TABLE_SCHEMA_COL},
-    t.table_name AS {_TABLE_NAME_COL},
-    c.column_name AS {_COLUMN_NAME_COL},
-    c.data_type AS {_DATATYPE_COL},
-    c.comment AS {_COLUMN_COMMENT_ALIAS},
-    t.comment AS {_TABLE_COMMENT_COL},
-    c.is_primary_key AS {_IS_PRIMARY_KEY_COL}
-FROM information_schema.tables t
-JOIN information_schema.columns c
-  ON t.table_schema = c.table_schema
- AND t.table_name = c.table_name
-WHERE {where_clause}
-"""
+    return _INFORMATION_SCHEMA_TEMPLATE.format_map({"where_clause": where_clause})
 
 
 def _fetch_columns_via_show(
@@ -592,21 +694,20 @@ def _fetch_columns_via_show(
     if not table_names:
         return pd.DataFrame()
 
-    rows: List[pd.DataFrame] = []
     category = _catalog_category(session, workspace)
     is_shared_catalog = category == "SHARED"
     catalog = workspace
     schema_token = table_schema or ""
 
-    for table_name in table_names:
+    def _fetch_table_columns(table_name: str) -> Optional[pd.DataFrame]:
         table_token = str(table_name).strip()
         if not table_token:
-            continue
+            return None
 
         override_catalog, override_schema, override_table = _split_identifier(table_token)
         table_leaf = override_table or table_token
         if not table_leaf:
-            continue
+            return None
 
         catalog_token = override_catalog or catalog
         schema_token_override = override_schema or schema_token
@@ -640,7 +741,7 @@ def _fetch_columns_via_show(
         df = pd.DataFrame()
         df_source = ""
         for identifier in identifier_candidates:
-            query = f"SHOW COLUMNS IN {identifier}"
+            query = _SHOW_COLUMNS_TEMPLATE.format_map({"identifier": identifier})
             try:
                 df = session.sql(query).to_pandas()
                 df_source = "SHOW COLUMNS"
@@ -650,7 +751,9 @@ def _fetch_columns_via_show(
                 )
                 df = pd.DataFrame()
             if df.empty:
-                describe_query = f"DESCRIBE TABLE {identifier}"
+                describe_query = _DESCRIBE_TABLE_TEMPLATE.format_map(
+                    {"identifier": identifier}
+                )
                 try:
                     describe_df = session.sql(describe_query).to_pandas()
                 except Exception as exc:
@@ -664,7 +767,7 @@ def _fetch_columns_via_show(
             if not df.empty:
                 break
         if df.empty:
-            continue
+            return None
         if df_source == "DESCRIBE TABLE":
             if "KIND" in df.columns:
                 df = df[df["KIND"].astype(str).str.upper() == "COLUMN"]
@@ -676,7 +779,7 @@ def _fetch_columns_via_show(
             if rename_map:
                 df = df.rename(columns=rename_map)
             if df.empty:
-                continue
+                return None
         df.columns = [str(col).upper() for col in df.columns]
         schema_col = next(
             (col for col in ("TABLE_SCHEMA", "SCHEMA_NAME") if col in df.columns), None
@@ -715,7 +818,17 @@ def _fetch_columns_via_show(
         normalized[_COLUMN_COMMENT_ALIAS] = df[comment_col] if comment_col else ""
         normalized[_TABLE_COMMENT_COL] = ""
         normalized[_IS_PRIMARY_KEY_COL] = False
-        rows.append(normalized)
+        return normalized
+
+    # Each table needs its own SHOW COLUMNS / DESCRIBE round-trip; run them
+    # concurrently since they are network-bound. ``map`` keeps input order.
+    max_workers = max(1, min(_SHOW_COLUMNS_MAX_WORKERS, len(table_names)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rows = [
+            df
+            for df in executor.map(_fetch_table_columns, table_names)
+            if df is not None
+        ]
 
     if not rows:
         return pd.DataFrame()
@@ -750,6 +863,41 @@ def get_valid_schemas_tables_columns_df(
             logger.debug("information_schema query failed: {}", exc)
             result = pd.DataFrame()
 
+    if not result.empty and table_names:
+        # Only tables missing from the batched response need per-table SHOW COLUMNS.
+        result.columns = [str(col).upper() for col in result.columns]
+        returned_tables: set[str] = set()
+        returned_pairs: set[Tuple[str, str]] = set()
+        if _TABLE_NAME_COL in result.columns:
+            returned_names = result[_TABLE_NAME_COL].astype(str).str.upper()
+            returned_tables = set(returned_names)
+            if _TABLE_SCHEMA_COL in result.columns:
+                returned_schemas = result[_TABLE_SCHEMA_COL].astype(str).str.upper()
+                returned_pairs = set(zip(returned_schemas, returned_names))
+        # Compare (schema, table) so S2.T is not hidden by S1.T; a pair without
+        # a known schema (or a response without TABLE_SCHEMA) matches on name.
+        # One name per pair keeps a repeated table from being fetched twice.
+        missing_tables = [
+            name
+            for (schema_key, table_key), name in _table_filter_pairs_by_name(
+                table_schema, table_names
+            ).items()
+            if (
+                (schema_key, table_key) not in returned_pairs
+                if schema_key and returned_pairs
+                else table_key not in returned_tables
+            )
+        ]
+        if missing_tables:
+            fallback = _fetch_columns_via_show(
+                session=session,
+                workspace=workspace,
+                table_schema=table_schema,
+                table_names=missing_tables,
+            )
+            if not fallback.empty:
+                result = pd.concat([result, fallback], ignore_index=True)
+
     if result.empty:
         tables_for_show = table_names
         if not tables_for_show:
@@ -797,7 +945,9 @@ def get_valid_schemas_tables_columns_df(
             normalized = str(value).strip().upper()
             return normalized in {"TRUE", "YES", "1"}
 
-        result[_IS_PRIMARY_KEY_COL] = result[_IS_PRIMARY_KEY_COL].apply(_normalize_pk)
+        result[_IS_PRIMARY_KEY_COL] = (
+            result[_IS_PRIMARY_KEY_COL].apply(_normalize_pk).astype(bool)
+        )
     return result
 
 
@@ -822,14 +972,15 @@ def fetch_warehouses(session: Session) -> List[str]:
 
 
 def fetch_schemas_in_database(session: Session, workspace: str) -> List[str]:
+    config = env_vars.build_base_connection_config()
     temp_session = create_session(
-        service=env_vars.CLICKZETTA_SERVICE or "",
-        instance=env_vars.CLICKZETTA_INSTANCE or "",
+        service=config["service"],
+        instance=config["instance"],
         workspace=workspace,
         schema="",
-        username=env_vars.CLICKZETTA_USERNAME or "",
-        password=env_vars.CLICKZETTA_PASSWORD or "",
-        vcluster=env_vars.CLICKZETTA_VCLUSTER or "default_ap",
+        username=config["username"],
+        password=config["password"],
+        vcluster=config["vcluster"],
     )
     try:
         df = temp_session.sql("SHOW SCHEMAS").to_pandas()
@@ -950,12 +1101,13 @@ def fetch_stages_in_schema(connection: Any, schema_name: str) -> List[str]:
     stage_names: List[str] = ["volume:user://~/semantic_models/"]
     seen: set[str] = set(stage_names)
 
-    df = pd.DataFrame()
+    columns: List[str] = []
+    rows: List[tuple[Any, ...]] = []
     last_error: Optional[Exception] = None
     for query in queries:
         try:
-            df = _execute_query_to_pandas(connection, query)
-            if not df.empty:
+            columns, rows = _execute_query_to_rows(connection, query)
+            if rows:
                 break
         except Exception as exc:  # pragma: no cover - defensive fallback
             logger.debug("Stage/volume query failed ({}): {}", query, exc)
@@ -964,19 +1116,17 @@ def fetch_stages_in_schema(connection: Any, schema_name: str) -> List[str]:
         if last_error:
             raise last_error
 
-    if df.empty:
+    if not rows:
         return stage_names
 
-    name_column: Optional[str] = None
-    for column in df.columns:
-        if column.lower() in {"name", "volume_name", "stage_name"}:
-            name_column = column
+    name_index = 0
+    for index, column in enumerate(columns):
+        if str(column).lower() in {"name", "volume_name", "stage_name"}:
+            name_index = index
             break
-    if not name_column:
-        name_column = df.columns[0]
 
-    for value in df[name_column].tolist():
-        name = str(value)
+    for row in rows:
+        name = str(row[name_index])
         if name not in seen:
             stage_names.append(name)
             seen.add(name)
@@ -1039,15 +1189,12 @@ def fetch_yaml_names_in_stage(
         if not column_name:
             column_name = df.columns[0]
 
-        values = [str(value) for value in df[column_name].tolist() if value]
+        values = [str(value) for value in df[column_name].to_numpy() if value]
         base_prefix = f"{relative}/" if relative else ""
-        deduped: List[str] = []
-        seen_names: set[str] = set()
-        for name in _filter_yaml_names(values, base_prefix=base_prefix):
-            if name not in seen_names:
-                deduped.append(name)
-                seen_names.add(name)
-        return deduped
+        # dict.fromkeys de-duplicates while preserving listing order.
+        return list(
+            dict.fromkeys(_filter_yaml_names(values, base_prefix=base_prefix))
+        )
 
     # Legacy stage flow (compatibility shim)
     stage_candidates: List[str] = []
@@ -1057,8 +1204,6 @@ def fetch_yaml_names_in_stage(
     if "." in cleaned:
         stage_candidates.append(cleaned.split(".")[-1])
 
-    results: List[str] = []
-    seen: set[str] = set()
     for candidate in stage_candidates:
         list_sql = f"LIST @{candidate}"
         try:
@@ -1069,14 +1214,11 @@ def fetch_yaml_names_in_stage(
         if df.empty:
             continue
         name_column = "name" if "name" in df.columns else df.columns[0]
-        values = [str(value) for value in df[name_column].tolist() if value]
-        for file_name in _filter_yaml_names(values):
-            if file_name not in seen:
-                results.append(file_name)
-                seen.add(file_name)
+        values = [str(value) for value in df[name_column].to_numpy() if value]
+        results = list(dict.fromkeys(_filter_yaml_names(values)))
         if results:
-            break
-    return results
+            return results
+    return []
 
 
 def fetch_table_schema(session: Session, table_fqn: str) -> Dict[str, str]:
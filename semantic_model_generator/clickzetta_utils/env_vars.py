@@ -1,7 +1,7 @@
 import json
 import os
 from collections import deque
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -107,8 +107,12 @@ def _deep_lookup(mapping: Any, key: str) -> Optional[Any]:
     return None
 
 
-def _config_value(key: str, default: Optional[str] = None) -> Optional[str]:
-    env_value = os.getenv(f"CLICKZETTA_{key.upper()}")
+def _config_value(
+    key: str,
+    default: Optional[str] = None,
+    environ: Mapping[str, str] = os.environ,
+) -> Optional[str]:
+    env_value = environ.get(f"CLICKZETTA_{key.upper()}")
     if env_value:
         return env_value
     if CONFIG_CONNECTION:
@@ -142,47 +146,59 @@ if CONFIG_CONNECTION and isinstance(CONFIG_CONNECTION.get("hints"), dict):
     CLICKZETTA_HINTS = {str(k): str(v) for k, v in CONFIG_CONNECTION["hints"].items()}
 
 
-def build_base_connection_config() -> Dict[str, str]:
+def build_base_connection_config(
+    environ: Mapping[str, str] = os.environ,
+) -> Dict[str, str]:
     """
     Returns the base configuration dictionary used to establish Clickzetta sessions.
+
+    ``CLICKZETTA_*`` keys are read from ``environ`` (the process environment by
+    default) before falling back to the active ``connections.json`` entry.
     """
 
     config: Dict[str, str] = {
-        "service": CLICKZETTA_SERVICE or "",
-        "instance": CLICKZETTA_INSTANCE or "",
-        "workspace": CLICKZETTA_WORKSPACE or "",
-        "schema": CLICKZETTA_SCHEMA or "",
-        "username": CLICKZETTA_USERNAME or "",
-        "password": CLICKZETTA_PASSWORD or "",
-        "vcluster": CLICKZETTA_VCLUSTER or "default_ap",
+        "service": _config_value("service", environ=environ) or "",
+        "instance": _config_value("instance", environ=environ) or "",
+        "workspace": _config_value("workspace", environ=environ) or "",
+        "schema": _config_value("schema", environ=environ) or "",
+        "username": _config_value("username", environ=environ) or "",
+        "password": _config_value("password", environ=environ) or "",
+        "vcluster": _config_value("vcluster", "default_ap", environ=environ)
+        or "default_ap",
         "hints": CLICKZETTA_HINTS.copy(),
     }
     return config
 
 
-def assert_required_env_vars() -> List[str]:
+_REQUIRED_CONNECTION_KEYS = (
+    "service",
+    "instance",
+    "workspace",
+    "schema",
+    "username",
+    "password",
+)
+
+
+def assert_required_env_vars(
+    environ: Mapping[str, str] = os.environ,
+) -> List[str]:
     """
     Ensures that the required environment variables are set before proceeding.
 
+    Values are resolved by ``build_base_connection_config`` from the same
+    ``environ``, so validation always checks the settings sessions connect with.
+
     Returns:
         List[str]: Names of missing environment variables.
     """
 
-    missing_env_vars: List[str] = []
-    if not CLICKZETTA_SERVICE:
-        missing_env_vars.append("CLICKZETTA_SERVICE")
-    if not CLICKZETTA_INSTANCE:
-        missing_env_vars.append("CLICKZETTA_INSTANCE")
-    if not CLICKZETTA_WORKSPACE:
-        missing_env_vars.append("CLICKZETTA_WORKSPACE")
-    if not CLICKZETTA_SCHEMA:
-        missing_env_vars.append("CLICKZETTA_SCHEMA")
-    if not CLICKZETTA_USERNAME:
-        missing_env_vars.append("CLICKZETTA_USERNAME")
-    if not CLICKZETTA_PASSWORD:
-        missing_env_vars.append("CLICKZETTA_PASSWORD")
-
-    return missing_env_vars
+    config = build_base_connection_config(environ=environ)
+    return [
+        f"CLICKZETTA_{key.upper()}"
+        for key in _REQUIRED_CONNECTION_KEYS
+        if not config[key]
+    ]
 
 
 def _dashscope_value(key: str, env_key: Optional[str] = None) -> Optional[str]:
@@ -236,3 +252,4 @@ DASHSCOPE_TEMPERATURE = _dashscope_float_value("temperature", 0.2)
 DASHSCOPE_TOP_P = _dashscope_float_value("top_p", 0.85)
 DASHSCOPE_MAX_OUTPUT_TOKENS = _dashscope_int_value("max_output_tokens", 512)
 DASHSCOPE_TIMEOUT_SECONDS = _dashscope_float_value("timeout_seconds", 45.0)
+DASHSCOPE_CACHE_PATH = _dashscope_value("cache_path") or ""
@@ -1,3 +1,4 @@
+import functools
 import math
 import os
 import re
@@ -9,6 +10,11 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from clickzetta.zettapark.session import Session
 from loguru import logger
 
+try:
+    from rapidfuzz.distance import OSA as _RapidfuzzOSA  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _RapidfuzzOSA = None  # type: ignore
+
 from semantic_model_generator.clickzetta_utils.clickzetta_connector import (
     AUTOGEN_TOKEN,
     DIMENSION_DATATYPES,
@@ -26,6 +32,7 @@ from semantic_model_generator.clickzetta_utils.utils import (
 )
 from semantic_model_generator.data_processing import data_types, proto_utils
 from semantic_model_generator.llm import (
+    CachedDashscopeClient,
     DashscopeClient,
     DashscopeSettings,
     enrich_semantic_model,
@@ -47,14 +54,20 @@ _AUTOGEN_COMMENT_TOKEN = (
 )
 _DEFAULT_N_SAMPLE_VALUES_PER_COL = 10
 _AUTOGEN_COMMENT_WARNING = f"# NOTE: This file was auto-generated by the semantic model generator. Please fill out placeholders marked with {_FILL_OUT_TOKEN} (or remove if not relevant) and verify autogenerated comments.\n"
-_GENERIC_IDENTIFIER_TOKENS = {
-    "ID",
-    "NAME",
-    "CODE",
-    "KEY",
-    "VALUE",
-    "NUMBER",
-}
+_GENERIC_IDENTIFIER_TOKENS = frozenset(
+    {
+        "ID",
+        "NAME",
+        "CODE",
+        "KEY",
+        "VALUE",
+        "NUMBER",
+    }
+)
+
+
+_IDENTIFIER_SPLIT_RE = re.compile(r"[^0-9A-Za-z]+")
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
 
 
 def _singularize(token: str) -> str:
@@ -90,12 +103,12 @@ def _identifier_tokens(
     name: str, prefixes_to_drop: Optional[set[str]] = None
 ) -> List[str]:
     name = name.replace("-", "_")
-    raw_tokens = re.split(r"[^0-9A-Za-z]+", name)
+    raw_tokens = _IDENTIFIER_SPLIT_RE.split(name)
     tokens: List[str] = []
     for token in raw_tokens:
         if not token:
             continue
-        split = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", token).split()
+        split = _CAMEL_CASE_BOUNDARY_RE.sub(r"\1 \2", token).split()
         for part in split:
             tokens.append(part.upper())
     tokens = [token for token in tokens if token]
@@ -104,6 +117,7 @@ def _identifier_tokens(
     return tokens
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_generic_identifier(name: str) -> bool:
     tokens = [token for token in _identifier_tokens(name) if token]
     if not tokens:
@@ -323,6 +337,67 @@ def _is_identifier_like(column_name: str, base_type: str) -> bool:
     return False
 
 
+# Constant pattern tables for ``_should_exclude_from_relationship_matching``.
+# Built once at import; suffix checks pass tuples to ``str.endswith`` so every
+# suffix is tested in a single call.
+_SYSTEM_FIELD_PATTERNS = frozenset(
+    {
+        "CREATED_AT", "UPDATED_AT", "DELETED_AT", "MODIFIED_AT",
+        "CREATED_TIME", "UPDATED_TIME", "DELETED_TIME", "MODIFIED_TIME",
+        "CREATE_TIME", "UPDATE_TIME", "DELETE_TIME", "MODIFY_TIME",
+        "CREATED_DATE", "UPDATED_DATE", "DELETED_DATE", "MODIFIED_DATE",
+        "CREATE_DATE", "UPDATE_DATE", "DELETE_DATE", "MODIFY_DATE",
+        "CREATEDAT", "UPDATEDAT", "DELETEDAT", "MODIFIEDAT",
+        "TIMESTAMP", "DATETIME", "DATE_TIME",
+        "VERSION", "REVISION", "REV",
+        "ROWVERSION", "ROW_VERSION",
+        "ETAG", "E_TAG",
+        "CREATED_BY", "UPDATED_BY", "DELETED_BY", "MODIFIED_BY",
+        "CREATOR", "UPDATER", "MODIFIER",
+        "DESCRIPTION", "CONTENT", "COMMENT", "NOTE", "TEXT",  # System content fields
+        "AMOUNT", "PRICE", "COST", "QUANTITY", "BALANCE",  # System measurement fields
+    }
+)
+_SYSTEM_FIELD_SUFFIXES = ("_AT", "_TIME", "_DATE", "_BY", "_VERSION")
+_TIMESTAMP_COLUMN_PATTERNS = frozenset(
+    {
+        "CREATED_AT", "UPDATED_AT", "DELETED_AT", "MODIFIED_AT",
+        "CREATED_TIME", "UPDATED_TIME", "DELETED_TIME", "MODIFIED_TIME",
+        "CREATE_TIME", "UPDATE_TIME", "DELETE_TIME", "MODIFY_TIME",
+        "CREATEDAT", "UPDATEDAT", "DELETEDAT", "MODIFIEDAT",
+        "CREATED_DATE", "UPDATED_DATE", "DELETED_DATE", "MODIFIED_DATE",
+        "CREATE_DATE", "UPDATE_DATE", "DELETE_DATE", "MODIFY_DATE",
+        "TIMESTAMP", "DATETIME", "DATE_TIME",
+    }
+)
+_SURROGATE_KEY_INTEGER_TYPES = frozenset(
+    {"INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "NUMBER", "NUMERIC", "DECIMAL"}
+)
+_DATE_VALUE_TYPES = frozenset(
+    {"DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP_LTZ", "TIMESTAMP_NTZ", "TIMESTAMP_TZ", "TIME"}
+)
+_AUDIT_VERB_TOKENS = frozenset(
+    {"CREATED", "UPDATED", "DELETED", "MODIFIED", "CREATE", "UPDATE", "DELETE", "MODIFY"}
+)
+# "KEY"/"ID" tokens and tokens ending in them (e.g. DATEKEY, USERID).
+_KEY_TOKEN_SUFFIXES = ("KEY", "ID")
+_CONTENT_COLUMN_PATTERNS = frozenset(
+    {
+        "DESCRIPTION", "CONTENT", "COMMENT", "COMMENTS", "NOTE", "NOTES",
+        "TEXT", "BODY", "MESSAGE", "SUMMARY", "ABSTRACT",
+        "DESC", "DETAILS", "REMARKS", "MEMO",
+        "NAME", "TITLE", "LABEL",
+        # Enumeration / flag columns — never FK/PK reference columns.
+        "STATUS", "STATE", "TYPE", "TYPES", "FLAG", "FLAGS",
+        "PRIORITY", "LEVEL", "GRADE", "RANK", "STAGE",
+        "CATEGORY", "CLASS", "KIND", "MODE", "PHASE",
+    }
+)
+_MEASUREMENT_COLUMN_PATTERNS = frozenset(
+    {"AMOUNT", "PRICE", "COST", "TOTAL", "SUBTOTAL", "QUANTITY", "QTY", "COUNT", "SUM", "BALANCE"}
+)
+
+
 def _should_exclude_from_relationship_matching(column_name: str, base_type: str = None) -> bool:
     """
     Check if a column should be excluded from FK-PK relationship matching.
@@ -360,44 +435,15 @@ def _should_exclude_from_relationship_matching(column_name: str, base_type: str
             # These might be business keys, don't exclude
             return False
 
-        # Common system field patterns with underscore prefix
-        system_patterns = {
-            "CREATED_AT", "UPDATED_AT", "DELETED_AT", "MODIFIED_AT",
-            "CREATED_TIME", "UPDATED_TIME", "DELETED_TIME", "MODIFIED_TIME",
-            "CREATE_TIME", "UPDATE_TIME", "DELETE_TIME", "MODIFY_TIME",
-            "CREATED_DATE", "UPDATED_DATE", "DELETED_DATE", "MODIFIED_DATE",
-            "CREATE_DATE", "UPDATE_DATE", "DELETE_DATE", "MODIFY_DATE",
-            "CREATEDAT", "UPDATEDAT", "DELETEDAT", "MODIFIEDAT",
-            "TIMESTAMP", "DATETIME", "DATE_TIME",
-            "VERSION", "REVISION", "REV",
-            "ROWVERSION", "ROW_VERSION",
-            "ETAG", "E_TAG",
-            "CREATED_BY", "UPDATED_BY", "DELETED_BY", "MODIFIED_BY",
-            "CREATOR", "UPDATER", "MODIFIER",
-            "DESCRIPTION", "CONTENT", "COMMENT", "NOTE", "TEXT",  # System content fields
-            "AMOUNT", "PRICE", "COST", "QUANTITY", "BALANCE"  # System measurement fields
-        }
-
-        if stripped in system_patterns:
+        if stripped in _SYSTEM_FIELD_PATTERNS:
             return True
 
         # Also check if it ends with system patterns
-        for pattern in ["_AT", "_TIME", "_DATE", "_BY", "_VERSION"]:
-            if stripped.endswith(pattern):
-                return True
+        if stripped.endswith(_SYSTEM_FIELD_SUFFIXES):
+            return True
 
     # Exclude timestamp/date columns
-    timestamp_patterns = {
-        "CREATED_AT", "UPDATED_AT", "DELETED_AT", "MODIFIED_AT",
-        "CREATED_TIME", "UPDATED_TIME", "DELETED_TIME", "MODIFIED_TIME",
-        "CREATE_TIME", "UPDATE_TIME", "DELETE_TIME", "MODIFY_TIME",
-        "CREATEDAT", "UPDATEDAT", "DELETEDAT", "MODIFIEDAT",
-        "CREATED_DATE", "UPDATED_DATE", "DELETED_DATE", "MODIFIED_DATE",
-        "CREATE_DATE", "UPDATE_DATE", "DELETE_DATE", "MODIFY_DATE",
-        "TIMESTAMP", "DATETIME", "DATE_TIME"
-    }
-
-    if col_upper in timestamp_patterns:
+    if col_upper in _TIMESTAMP_COLUMN_PATTERNS:
         return True
 
     # Check for *_AT, *_DATE, *_TIME patterns
@@ -408,21 +454,18 @@ def _should_exclude_from_relationship_matching(column_name: str, base_type: str
     # date surrogate keys (e.g. order_date BIGINT referencing DIM_DATE.date_id) and
     # must NOT be excluded.  Use base_type as the primary signal; fall back to
     # name-only heuristics only when base_type is unavailable.
-    _INTEGER_TYPES = {"INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "NUMBER", "NUMERIC", "DECIMAL"}
-    _DATE_TYPES = {"DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP_LTZ", "TIMESTAMP_NTZ",
-                   "TIMESTAMP_TZ", "TIME"}
     _base = (base_type or "").upper().split("(")[0]
-    _type_is_integer = _base in _INTEGER_TYPES
-    _type_is_date = _base in _DATE_TYPES or _base.startswith("TIMESTAMP")
+    _type_is_integer = _base in _SURROGATE_KEY_INTEGER_TYPES
+    _type_is_date = _base in _DATE_VALUE_TYPES or _base.startswith("TIMESTAMP")
 
     for token in tokens:
-        if token.endswith("_AT") or token.endswith("AT"):
+        if token.endswith(("_AT", "AT")):
             # Check if it looks like a timestamp (not like STATUS_AT which might be valid)
             prev_tokens = [t for t in tokens if t != token]
-            if prev_tokens and prev_tokens[-1] in {"CREATED", "UPDATED", "DELETED", "MODIFIED", "CREATE", "UPDATE", "DELETE", "MODIFY"}:
+            if prev_tokens and prev_tokens[-1] in _AUDIT_VERB_TOKENS:
                 return True
         # Exclude *_DATE and *_TIME UNLESS it's followed by KEY/ID (like date_key, time_id)
-        if token.endswith("_DATE") or token.endswith("_TIME"):
+        if token.endswith(("_DATE", "_TIME")):
             # If the column is stored as an integer, it's a surrogate key — keep it.
             if _type_is_integer:
                 continue
@@ -430,7 +473,7 @@ def _should_exclude_from_relationship_matching(column_name: str, base_type: str
             token_idx = tokens.index(token)
             if token_idx < len(tokens) - 1:
                 next_token = tokens[token_idx + 1]
-                if next_token in {"KEY", "ID"} or next_token.endswith("KEY") or next_token.endswith("ID"):
+                if next_token.endswith(_KEY_TOKEN_SUFFIXES):
                     continue  # date_key, time_id are OK
             return True
         # Exclude bare DATE, TIME, TIMESTAMP columns UNLESS they have KEY/ID suffix
@@ -439,47 +482,35 @@ def _should_exclude_from_relationship_matching(column_name: str, base_type: str
             if _type_is_integer:
                 continue
             # Check if there's a KEY or ID token
-            has_key_id = any(t in {"KEY", "ID"} or t.endswith("KEY") or t.endswith("ID") for t in tokens)
+            has_key_id = any(t.endswith(_KEY_TOKEN_SUFFIXES) for t in tokens)
             if not has_key_id:
                 return True
 
     # Exclude content/text fields and name fields
     # NAME is a descriptive field, NOT a key field
     # This prevents false positives like: C_NAME = P_NAME, S_NAME = N_NAME
-    content_patterns = {
-        "DESCRIPTION", "CONTENT", "COMMENT", "COMMENTS", "NOTE", "NOTES",
-        "TEXT", "BODY", "MESSAGE", "SUMMARY", "ABSTRACT",
-        "DESC", "DETAILS", "REMARKS", "MEMO",
-        "NAME", "TITLE", "LABEL",
-        # Enumeration / flag columns — never FK/PK reference columns.
-        "STATUS", "STATE", "TYPE", "TYPES", "FLAG", "FLAGS",
-        "PRIORITY", "LEVEL", "GRADE", "RANK", "STAGE",
-        "CATEGORY", "CLASS", "KIND", "MODE", "PHASE",
-    }
-
-    if col_upper in content_patterns:
+    if col_upper in _CONTENT_COLUMN_PATTERNS:
         return True
 
     for token in tokens:
-        if token in content_patterns:
+        if token in _CONTENT_COLUMN_PATTERNS:
             # But allow if it's part of an ID pattern (rare but possible)
             # Exception: NAME_ID, TITLE_ID would be OK as keys
             # Check if ANY token has ID or KEY (not just this token)
-            has_id_or_key = any(t in {"ID", "KEY"} or t.endswith("_ID") or t.endswith("_KEY")
-                               for t in tokens if t != token)
+            has_id_or_key = any(
+                t in {"ID", "KEY"} or t.endswith(("_ID", "_KEY"))
+                for t in tokens
+                if t != token
+            )
             if not has_id_or_key:
                 return True
 
     # Exclude measurement fields without ID/KEY suffix
     # (amount_id or price_id would be OK, but amount or price alone are not keys)
-    measurement_patterns = {"AMOUNT", "PRICE", "COST", "TOTAL", "SUBTOTAL",
-                           "QUANTITY", "QTY", "COUNT", "SUM", "BALANCE"}
-
     for token in tokens:
-        if token in measurement_patterns:
+        if token in _MEASUREMENT_COLUMN_PATTERNS:
             # Check if it has ID/KEY suffix
-            has_id_suffix = any(t in {"ID", "KEY"} or t.endswith("ID") or t.endswith("KEY")
-                               for t in tokens)
+            has_id_suffix = any(t.endswith(_KEY_TOKEN_SUFFIXES) for t in tokens)
             if not has_id_suffix:
                 return True
 
@@ -582,24 +613,26 @@ def _column_mentions_table(column_name: str, table_name: str) -> bool:
                     return True
     return False
 
-_GENERIC_PREFIXES = {
-    "DIM",
-    "FACT",
-    "FCT",
-    "BRIDGE",
-    "BRG",
-    "STG",
-    "ODS",
-    "OD",
-    "DW",
-    "VW",
-    "VIEW",
-    "HUB",
-    "SAT",
-    "LNK",
-    "TMP",
-    "TMPV",
-}
+_GENERIC_PREFIXES = frozenset(
+    {
+        "DIM",
+        "FACT",
+        "FCT",
+        "BRIDGE",
+        "BRG",
+        "STG",
+        "ODS",
+        "OD",
+        "DW",
+        "VW",
+        "VIEW",
+        "HUB",
+        "SAT",
+        "LNK",
+        "TMP",
+        "TMPV",
+    }
+)
 
 
 def _table_prefixes(table_name: str) -> set[str]:
@@ -827,31 +860,41 @@ def _qualified_table_name(fqn: data_types.FQNParts) -> str:
 
 def _levenshtein_distance(s1: str, s2: str) -> int:
     """
-    Calculate Levenshtein distance between two strings.
+    Calculate edit distance between two strings, counting an adjacent
+    transposition (e.g. CUSTOMRE vs CUSTOMER) as a single edit.
     Used for fuzzy column name matching.
     """
+    if _RapidfuzzOSA is not None:
+        return _RapidfuzzOSA.distance(s1, s2)
     if len(s1) < len(s2):
         return _levenshtein_distance(s2, s1)
     if len(s2) == 0:
         return len(s1)
 
-    previous_row = range(len(s2) + 1)
+    # Optimal string alignment: Levenshtein plus adjacent transpositions.
+    before_previous_row: List[int] = []
+    previous_row = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1):
         current_row = [i + 1]
         for j, c2 in enumerate(s2):
             insertions = previous_row[j + 1] + 1
             deletions = current_row[j] + 1
             substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+            best = min(insertions, deletions, substitutions)
+            if i and j and c1 == s2[j - 1] and s1[i - 1] == c2 and c1 != c2:
+                best = min(best, before_previous_row[j - 1] + 1)
+            current_row.append(best)
+        before_previous_row, previous_row = previous_row, current_row
 
     return previous_row[-1]
 
 
+@functools.lru_cache(maxsize=16384)
 def _name_similarity(name1: str, name2: str) -> float:
     """
     Calculate column name similarity using universal patterns.
     Returns a score between 0.0 (completely different) and 1.0 (identical).
+    Memoized because the same column-name pairs recur across table pairs.
     """
     if not name1 or not name2:
         return 0.0
@@ -996,7 +1039,9 @@ def _are_entity_variants(entity1: str, entity2: str) -> bool:
 
     # Check string similarity for close matches using Levenshtein ratio
     max_len = max(len(e1), len(e2))
-    if max_len:
+    # The edit distance is at least the length difference, so skip the
+    # quadratic computation when that alone rules out the threshold.
+    if max_len and 1.0 - (abs(len(e1) - len(e2)) / max_len) > 0.85:
         distance = _levenshtein_distance(e1.upper(), e2.upper())
         similarity = 1.0 - (distance / max_len)
         if similarity > 0.85:  # Very high similarity threshold
@@ -1109,6 +1154,22 @@ def _generate_optimized_relationship_candidates(metadata, _record_pair, status_d
                     "table": table_name
                 }
 
+    # Bucket PK candidates by base type. FKs only ever pair with same-typed PKs,
+    # and the PK-side exclusion check and core entity do not depend on the FK,
+    # so compute them once per PK instead of once per (FK, PK) pair.
+    pk_candidates_by_type: Dict[str, List[Tuple[str, str, Dict[str, Any], str]]] = (
+        defaultdict(list)
+    )
+    for (pk_table_name, pk_norm), pk_info in pk_lookup.items():
+        pk_name = pk_info["meta"]["names"][0]
+        if _should_exclude_from_relationship_matching(
+            pk_name, pk_info["meta"]["base_type"]
+        ):
+            continue
+        pk_candidates_by_type[pk_info["meta"]["base_type"]].append(
+            (pk_table_name, pk_norm, pk_info, _extract_core_entity(pk_name))
+        )
+
     # For each table, find potential foreign key candidates
     for fk_table_name, fk_table_meta in metadata.items():
         if status_dict["limited_by_timeout"]:
@@ -1148,20 +1209,17 @@ def _generate_optimized_relationship_candidates(metadata, _record_pair, status_d
             # A foreign key column can reference multiple tables' primary keys in different relationships
             # (e.g., LINEITEM.L_PARTKEY can reference both PART.P_PARTKEY and participate in PARTSUPP relationship)
             all_matches = []
+            fk_core = _extract_core_entity(fk_meta["names"][0])
 
-            for (pk_table_name, pk_norm), pk_info in pk_lookup.items():
+            # Excluded PK columns and type-incompatible PKs are filtered out by
+            # the pk_candidates_by_type bucketing above.
+            for pk_table_name, pk_norm, pk_info, pk_core in pk_candidates_by_type.get(
+                fk_meta["base_type"], ()
+            ):
                 # Skip same table
                 if pk_table_name == fk_table_name:
                     continue
 
-                # CRITICAL: Also exclude PK columns that shouldn't be used for relationships
-                if _should_exclude_from_relationship_matching(pk_info["meta"]["names"][0], pk_info["meta"]["base_type"]):
-                    continue
-
-                # Type compatibility check
-                if fk_meta["base_type"] != pk_info["meta"]["base_type"]:
-                    continue
-
                 # Guard A: suppress PK<->PK matches. When the FK column is its own
                 # table's sole primary key AND the matched column is the other
                 # table's sole primary key, the two tables both *own* the same
@@ -1182,9 +1240,8 @@ def _generate_optimized_relationship_candidates(metadata, _record_pair, status_d
                 # Calculate enhanced name similarity
                 similarity = _name_similarity(fk_meta["names"][0], pk_info["meta"]["names"][0])
 
-                # Universal enhancement: Core entity matching
-                fk_core = _extract_core_entity(fk_meta["names"][0])
-                pk_core = _extract_core_entity(pk_info["meta"]["names"][0])
+                # Universal enhancement: Core entity matching (fk_core/pk_core
+                # are precomputed per column)
 
                 # Semantic validation - reject obviously wrong matches but allow hierarchical containment
                 # SKIP semantic validation if entity names are too short (unreliable)
@@ -3541,6 +3598,19 @@ def _infer_join_type(
     return default_join
 
 
+_GENERIC_SHARED_COLUMN_NAMES = _GENERIC_IDENTIFIER_TOKENS | {
+    "TYPE", "STATUS", "STATE", "ACTIVE", "ENABLED", "DELETED",
+    "CREATED", "UPDATED", "MODIFIED", "VERSION", "LEVEL"
+}
+
+# Prefixes of {prefix}_ID / {prefix}_KEY columns that name a role rather than
+# an entity, so they cannot identify the referenced table.
+_GENERIC_FK_ROLE_PREFIXES = frozenset(
+    {"PARENT", "CHILD", "REF", "REFERENCE", "FK", "FOREIGN"}
+)
+_GENERIC_FK_PATTERN_PREFIXES = _GENERIC_FK_ROLE_PREFIXES | {"MAIN", "SUPER"}
+
+
 def _is_valid_shared_column_relationship(fk_column: str, pk_column: str, pk_table: str, fk_table: str) -> bool:
     """
     Pure column-pattern-based validation for shared column relationships.
@@ -3575,12 +3645,7 @@ def _is_valid_shared_column_relationship(fk_column: str, pk_column: str, pk_tabl
     column_upper = pk_column.upper()
 
     # Reject generic column names that shouldn't form relationships
-    generic_columns = _GENERIC_IDENTIFIER_TOKENS | {
-        "TYPE", "STATUS", "STATE", "ACTIVE", "ENABLED", "DELETED",
-        "CREATED", "UPDATED", "MODIFIED", "VERSION", "LEVEL"
-    }
-
-    if column_upper in generic_columns:
+    if column_upper in _GENERIC_SHARED_COLUMN_NAMES:
         return False
 
     # For meaningful specific column names, allow the relationship
@@ -3683,8 +3748,7 @@ def _is_valid_suffix_match(fk_column: str, pk_column: str, pk_table: str) -> boo
             return False
 
         # Reject generic prefixes that don't indicate relationships
-        generic_prefixes = {"PARENT", "CHILD", "REF", "REFERENCE", "FK", "FOREIGN"}
-        if prefix in generic_prefixes:
+        if prefix in _GENERIC_FK_ROLE_PREFIXES:
             return False
 
         # Allow if prefix appears to be a meaningful entity name
@@ -3789,8 +3853,7 @@ def _looks_like_foreign_key(fk_table: str, pk_table: str, fk_column: str) -> boo
         prefix = fk_upper[:-3] if fk_upper.endswith("_ID") else fk_upper[:-4]
         if len(prefix) >= 2:  # Meaningful prefix required
             # Reject generic prefixes that don't indicate relationships
-            generic_prefixes = {"PARENT", "CHILD", "REF", "REFERENCE", "FK", "FOREIGN", "MAIN", "SUPER"}
-            if prefix not in generic_prefixes:
+            if prefix not in _GENERIC_FK_PATTERN_PREFIXES:
                 if _column_mentions_table(fk_column, pk_table):
                     return True
 
@@ -5308,17 +5371,23 @@ def raw_schema_to_semantic_context(
                 top_p=settings.top_p,
                 max_output_tokens=settings.max_output_tokens,
                 timeout_seconds=settings.timeout_seconds,
+                cache_path=settings.cache_path,
             )
-            client = DashscopeClient(settings)
-            enrich_semantic_model(
-                context,
-                raw_tables_metadata,
-                client,
-                placeholder=_PLACEHOLDER_COMMENT,
-                custom_prompt=llm_custom_prompt,
-                session=conn,
-                progress_tracker=progress_tracker,
+            client = (
+                CachedDashscopeClient(settings)
+                if settings.cache_path
+                else DashscopeClient(settings)
             )
+            with client:
+                enrich_semantic_model(
+                    context,
+                    raw_tables_metadata,
+                    client,
+                    placeholder=_PLACEHOLDER_COMMENT,
+                    custom_prompt=llm_custom_prompt,
+                    session=conn,
+                    progress_tracker=progress_tracker,
+                )
             _notify("DashScope enrichment complete.")
         else:
             logger.warning(
@@ -4,10 +4,15 @@ from typing import Optional
 
 from semantic_model_generator.clickzetta_utils import env_vars
 
-from .dashscope_client import DashscopeClient, DashscopeSettings
+from .dashscope_client import (
+    CachedDashscopeClient,
+    DashscopeClient,
+    DashscopeSettings,
+)
 from .enrichment import enrich_semantic_model
 
 __all__ = [
+    "CachedDashscopeClient",
     "DashscopeClient",
     "DashscopeSettings",
     "enrich_semantic_model",
@@ -29,6 +34,7 @@ def get_dashscope_settings() -> Optional[DashscopeSettings]:
         top_p=env_vars.DASHSCOPE_TOP_P,
         max_output_tokens=env_vars.DASHSCOPE_MAX_OUTPUT_TOKENS,
         timeout_seconds=env_vars.DASHSCOPE_TIMEOUT_SECONDS,
+        cache_path=env_vars.DASHSCOPE_CACHE_PATH.strip(),
     )
 
 
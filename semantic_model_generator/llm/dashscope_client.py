@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 from urllib.parse import urlparse, urlunparse
 
 from loguru import logger
@@ -15,6 +21,13 @@ except ImportError:  # pragma: no cover - optional dependency
     dashscope = None  # type: ignore
     Generation = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
 
 @dataclass(frozen=True)
 class DashscopeSettings:
@@ -25,6 +38,7 @@ class DashscopeSettings:
     top_p: float = 0.85
     max_output_tokens: int = 512
     timeout_seconds: float = 45.0
+    cache_path: str = ""
 
 
 class DashscopeError(RuntimeError):
@@ -65,65 +79,76 @@ class DashscopeClient:
         self._settings = settings
         self._normalized_base_url = _normalize_base_url(settings.base_url)
 
-    def chat_completion(self, messages: List[Dict[str, str]]) -> DashscopeResponse:
+    @property
+    def settings(self) -> DashscopeSettings:
+        return self._settings
+
+    def close(self) -> None:
+        """Releases client resources; the plain client holds none."""
+
+    def __enter__(self) -> "DashscopeClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Any,
+    ) -> None:
+        self.close()
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_output_tokens: Optional[int] = None,
+    ) -> DashscopeResponse:
+        """
+        Runs one chat completion. ``max_output_tokens`` overrides the configured
+        output budget for this call only.
+        """
         if dashscope is None or Generation is None:  # pragma: no cover - double guard
             raise DashscopeError(
                 "DashScope Python SDK is not installed. Please add `dashscope` to your environment."
             )
 
-        dashscope.api_key = self._settings.api_key
-        os.environ.setdefault("DASHSCOPE_API_KEY", self._settings.api_key)
+        # Key and endpoint go with the request rather than through os.environ or
+        # dashscope module globals, so concurrent calls cannot interfere.
+        endpoint_kwargs: Dict[str, Any] = {}
+        if self._normalized_base_url:
+            endpoint_kwargs["base_address"] = self._normalized_base_url
 
-        response = None
-        managed_env_keys = [
-            "DASHSCOPE_API_BASE",
-            "DASHSCOPE_BASE_URL",
-            "DASHSCOPE_COMPAT_URL",
-        ]
-        previous_env: Dict[str, Optional[str]] = {}
-        try:
-            for key in managed_env_keys:
-                previous_env[key] = os.environ.pop(key, None)
-
-            normalized_base_url = self._normalized_base_url
-            if normalized_base_url:
-                os.environ["DASHSCOPE_BASE_URL"] = normalized_base_url
-                if hasattr(dashscope, "base_http_api_url"):
-                    dashscope.base_http_api_url = normalized_base_url  # type: ignore[attr-defined]
-
-            model_name = self._settings.model or "qwen-plus"
-            dashscope_model: Any = model_name
-            if isinstance(model_name, str):
-                normalized = model_name.strip().lower().replace("-", "_")
-                if normalized.endswith("_latest"):
-                    normalized = normalized[: -len("_latest")]
-                if "embedding" in normalized:
-                    normalized = "qwen_plus"
-                if hasattr(Generation.Models, normalized):
-                    dashscope_model = getattr(Generation.Models, normalized)
-                elif "qwen" in normalized:
-                    dashscope_model = "qwen-plus"
-                else:
-                    dashscope_model = Generation.Models.qwen_plus
+        model_name = self._settings.model or "qwen-plus"
+        dashscope_model: Any = model_name
+        if isinstance(model_name, str):
+            normalized = model_name.strip().lower().replace("-", "_")
+            if normalized.endswith("_latest"):
+                normalized = normalized[: -len("_latest")]
+            if "embedding" in normalized:
+                normalized = "qwen_plus"
+            if hasattr(Generation.Models, normalized):
+                dashscope_model = getattr(Generation.Models, normalized)
+            elif "qwen" in normalized:
+                dashscope_model = "qwen-plus"
+            else:
+                dashscope_model = Generation.Models.qwen_plus
 
+        try:
             response = Generation.call(
                 model=dashscope_model,
                 messages=messages,
+                api_key=self._settings.api_key,
                 stream=False,
                 result_format="message",
                 temperature=self._settings.temperature,
                 top_p=self._settings.top_p,
-                max_output_tokens=self._settings.max_output_tokens,
+                max_output_tokens=(
+                    max_output_tokens or self._settings.max_output_tokens
+                ),
                 timeout=self._settings.timeout_seconds,
+                **endpoint_kwargs,
             )
         except Exception as exc:  # pragma: no cover - SDK raised error
             raise DashscopeError(f"DashScope request failed: {exc}") from exc
-        finally:
-            for key, value in previous_env.items():
-                if value is None:
-                    os.environ.pop(key, None)
-                else:
-                    os.environ[key] = value
 
         if response is None:
             raise DashscopeError("DashScope call did not return a response.")
@@ -163,3 +188,152 @@ class DashscopeClient:
 
         request_id = getattr(response, "request_id", None)
         return DashscopeResponse(content=content, request_id=request_id)
+
+
+def _loads_json(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers beyond 64 bits, which
+            # json accepts; retry there before treating the reply as invalid.
+            pass
+    return json.loads(text)
+
+
+def load_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the JSON object embedded in a completion (bare or fenced), or None
+    when the reply holds no object. Raises ``json.JSONDecodeError`` when the
+    extracted text does not parse.
+    """
+    match = _JSON_OBJECT_PATTERN.search(content)
+    json_text = match.group(0) if match else content
+    data = _loads_json(json_text.strip().strip("`"))
+    return data if isinstance(data, dict) else None
+
+
+def _is_cacheable_content(content: str) -> bool:
+    """True when ``content`` carries the JSON object enrichment parses out of it."""
+    if not content:
+        return False
+    try:
+        return load_json_object(content) is not None
+    except json.JSONDecodeError:
+        return False
+
+
+class CachedDashscopeClient(DashscopeClient):
+    """
+    DashscopeClient that memoizes successful completions in a SQLite file.
+
+    Requests are keyed by a SHA256 of the endpoint, model, sampling parameters and
+    messages, so re-running enrichment over unchanged tables skips the remote
+    call. Errors and replies without a parseable JSON object are never cached, so
+    one bad reply is retried rather than replayed. Entries expire after
+    ``ttl_seconds`` and the table is pruned to the newest ``max_entries`` rows.
+    Use as a context manager (or call ``close()``) to release the connection.
+    """
+
+    DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60.0
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        settings: DashscopeSettings,
+        cache_path: str = "",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(settings)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._cache_lock = threading.Lock()
+        path = cache_path or settings.cache_path or ":memory:"
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._cache = sqlite3.connect(path, check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, content TEXT NOT NULL, request_id TEXT, "
+            "created_at REAL NOT NULL)"
+        )
+        self._cache.execute(
+            "CREATE INDEX IF NOT EXISTS completions_created_at "
+            "ON completions (created_at)"
+        )
+        self._cache.commit()
+        # Upper bound on stored rows (a replaced key still counts once more), so
+        # pruning runs only once the table may have outgrown ``max_entries``.
+        self._entry_count = self._cache.execute(
+            "SELECT COUNT(*) FROM completions"
+        ).fetchone()[0]
+
+    def _cache_key(
+        self, messages: List[Dict[str, str]], max_output_tokens: Optional[int] = None
+    ) -> str:
+        signature = json.dumps(
+            {
+                "base_url": self._normalized_base_url,
+                "model": self._settings.model,
+                "temperature": self._settings.temperature,
+                "top_p": self._settings.top_p,
+                "max_output_tokens": (
+                    max_output_tokens or self._settings.max_output_tokens
+                ),
+                "messages": messages,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_output_tokens: Optional[int] = None,
+    ) -> DashscopeResponse:
+        key = self._cache_key(messages, max_output_tokens)
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT content, request_id FROM completions "
+                "WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self._ttl_seconds),
+            ).fetchone()
+        if row is not None:
+            logger.debug("DashScope cache hit for {}", key[:12])
+            return DashscopeResponse(content=row[0], request_id=row[1])
+
+        response = super().chat_completion(messages, max_output_tokens)
+        if not _is_cacheable_content(response.content):
+            logger.debug("Not caching DashScope reply without a JSON object")
+            return response
+        now = time.time()
+        with self._cache_lock:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?)",
+                (key, response.content, response.request_id, now),
+            )
+            self._entry_count += 1
+            if self._entry_count > self._max_entries:
+                self._prune(now)
+            self._cache.commit()
+        return response
+
+    def _prune(self, now: float) -> None:
+        """Drops expired rows and all but the newest ``max_entries``; lock held."""
+        self._cache.execute(
+            "DELETE FROM completions WHERE created_at < ?", (now - self._ttl_seconds,)
+        )
+        count = self._cache.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+        if count > self._max_entries:
+            self._cache.execute(
+                "DELETE FROM completions WHERE key IN ("
+                "SELECT key FROM completions ORDER BY created_at LIMIT ?)",
+                (count - self._max_entries,),
+            )
+        self._entry_count = min(count, self._max_entries)
+
+    def close(self) -> None:
+        with self._cache_lock:
+            self._cache.close()
@@ -3,14 +3,25 @@ from __future__ import annotations
 import json
 import re
 import time
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from loguru import logger
 
 from semantic_model_generator.data_processing import data_types
 from semantic_model_generator.protos import semantic_model_pb2
 
-from .dashscope_client import DashscopeClient, DashscopeError
+from .dashscope_client import DashscopeClient, DashscopeError, load_json_object
 from .progress_tracker import EnrichmentProgressTracker, EnrichmentStage
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -18,7 +29,6 @@ if TYPE_CHECKING:  # pragma: no cover
 else:  # Fallback type when ClickZetta libraries are unavailable
     Session = Any  # type: ignore
 
-_JSON_BLOCK_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
 _NUMERIC_TYPES = {
     "NUMBER",
     "DECIMAL",
@@ -30,6 +40,17 @@ _NUMERIC_TYPES = {
     "SMALLINT",
 }
 _NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+_TABLE_ENRICHMENT_MAX_WORKERS = 8
+_VERIFIED_QUERY_VALIDATION_MAX_WORKERS = 8
+# The fused model-level completion carries a description plus up to three
+# metrics and three SQL queries, which does not fit the per-table default.
+_MODEL_LEVEL_MAX_OUTPUT_TOKENS = 2048
+# Payload key for each model-level section and the JSON type it must have.
+_MODEL_LEVEL_SECTIONS: Tuple[Tuple[str, str, type], ...] = (
+    ("include_description", "model_description", str),
+    ("include_metrics", "model_metrics", list),
+    ("include_verified_queries", "verified_queries", list),
+)
 
 SYSTEM_PROMPT = (
     "You are an experienced ClickZetta data analyst. "
@@ -79,7 +100,8 @@ def enrich_semantic_model(
     }
     metric_notes: List[str] = []
 
-    # Process each table with progress tracking
+    # Build every table prompt up front so they all see the same model state.
+    pending: List[Tuple[int, semantic_model_pb2.Table, data_types.Table, Any]] = []
     for table_index, table in enumerate(model.tables):
         raw_table = raw_lookup.get(table.name.upper())
         if not raw_table:
@@ -87,45 +109,67 @@ def enrich_semantic_model(
                 "No raw metadata for table {}; skipping enrichment.", table.name
             )
             continue
-
-        # Update progress for current table
-        if progress_tracker:
-            progress_tracker.update_progress(
-                EnrichmentStage.TABLE_ENRICHMENT,
-                table_index + 1,
-                total_tables,
-                table_name=table.name,
-                message=f"Enriching table {table.name}",
-            )
-
         try:
             payload = _serialize_table_prompt(
                 table, raw_table, model.description, placeholder, custom_prompt
             )
-            response = client.chat_completion(payload["messages"])
-            enrichment = _parse_llm_response(response.content)
-            if enrichment:
-                updates = _apply_enrichment(table, raw_table, enrichment, placeholder)
-                note = updates.get("business_notes")
-                if note and not updates.get("metrics_added"):
-                    metric_notes.append(f"{table.name}: {note}")
-                model_description = updates.get("model_description")
-                if (
-                    model_description
-                    and isinstance(model_description, str)
-                    and (
-                        model.description == placeholder
-                        or not model.description.strip()
-                    )
-                ):
-                    model.description = model_description.strip()
-        except (
-            DashscopeError
-        ) as exc:  # pragma: no cover - network failures or remote errors
-            logger.warning("DashScope enrichment failed for {}: {}", table.name, exc)
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.exception("Unexpected error enriching table {}: {}", table.name, exc)
-    # Model description generation
+            continue
+        pending.append((table_index, table, raw_table, payload["messages"]))
+
+    # The DashScope calls are network-bound, so issue them concurrently and
+    # apply the responses in table order to keep the result deterministic.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_TABLE_ENRICHMENT_MAX_WORKERS, len(pending)))
+    ) as executor:
+        futures = [
+            executor.submit(client.chat_completion, messages)
+            for _, _, _, messages in pending
+        ]
+        for (table_index, table, raw_table, _), future in zip(pending, futures):
+            # Update progress for current table
+            if progress_tracker:
+                progress_tracker.update_progress(
+                    EnrichmentStage.TABLE_ENRICHMENT,
+                    table_index + 1,
+                    total_tables,
+                    table_name=table.name,
+                    message=f"Enriching table {table.name}",
+                )
+
+            try:
+                response = future.result()
+                enrichment = _parse_llm_response(response.content)
+                if enrichment:
+                    updates = _apply_enrichment(
+                        table, raw_table, enrichment, placeholder
+                    )
+                    note = updates.get("business_notes")
+                    if note and not updates.get("metrics_added"):
+                        metric_notes.append(f"{table.name}: {note}")
+                    model_description = updates.get("model_description")
+                    if (
+                        model_description
+                        and isinstance(model_description, str)
+                        and (
+                            model.description == placeholder
+                            or not model.description.strip()
+                        )
+                    ):
+                        model.description = model_description.strip()
+            except (
+                DashscopeError
+            ) as exc:  # pragma: no cover - network failures or remote errors
+                logger.warning(
+                    "DashScope enrichment failed for {}: {}", table.name, exc
+                )
+            except Exception as exc:  # pragma: no cover - defensive guard
+                logger.exception(
+                    "Unexpected error enriching table {}: {}", table.name, exc
+                )
+    # Description, model metrics and verified queries are requested in a single
+    # completion; each section is only asked for when it will be applied.
     if progress_tracker:
         progress_tracker.update_progress(
             EnrichmentStage.MODEL_DESCRIPTION,
@@ -134,8 +178,28 @@ def enrich_semantic_model(
             message="Generating model description",
         )
 
-    if model.description == placeholder or not model.description.strip():
-        _summarize_model_description(model, client, placeholder)
+    include_description = (
+        model.description == placeholder or not model.description.strip()
+    )
+    include_metrics = _model_metrics_writable(model)
+    include_verified_queries = session is not None
+    if not include_verified_queries:
+        logger.debug(
+            "Skipping verified query generation because no ClickZetta session was provided."
+        )
+
+    overview = _build_model_overview(model, raw_lookup, raw_tables)
+    model_payload = _request_model_level_payload(
+        client,
+        overview,
+        custom_prompt,
+        include_description=include_description,
+        include_metrics=include_metrics,
+        include_verified_queries=include_verified_queries,
+    )
+
+    if include_description:
+        _apply_model_description(model, model_payload)
 
     if progress_tracker:
         progress_tracker.update_progress(
@@ -154,13 +218,11 @@ def enrich_semantic_model(
             message="Generating model-level metrics",
         )
 
-    overview = _build_model_overview(model, raw_lookup, raw_tables)
-    try:
-        _generate_model_metrics(model, overview, client, placeholder, custom_prompt)
-    except DashscopeError as exc:
-        logger.warning("Failed to generate model-level metrics: {}", exc)
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.exception("Unexpected error generating model metrics: {}", exc)
+    if include_metrics:
+        try:
+            _apply_model_metrics(model, model_payload, placeholder)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.exception("Unexpected error generating model metrics: {}", exc)
 
     if progress_tracker:
         progress_tracker.update_progress(
@@ -176,19 +238,11 @@ def enrich_semantic_model(
             message="Generating verified queries",
         )
 
-    try:
-        _generate_verified_queries(
-            model,
-            overview,
-            client,
-            placeholder,
-            custom_prompt,
-            session=session,
-        )
-    except DashscopeError as exc:
-        logger.warning("Failed to generate verified queries: {}", exc)
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.exception("Unexpected error generating verified queries: {}", exc)
+    if include_verified_queries:
+        try:
+            _apply_verified_queries(model, model_payload, session)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.exception("Unexpected error generating verified queries: {}", exc)
 
     if progress_tracker:
         progress_tracker.update_progress(
@@ -306,19 +360,13 @@ def _serialize_table_prompt(
 def _parse_llm_response(content: str) -> Optional[Dict[str, object]]:
     if not content:
         return None
-    match = _JSON_BLOCK_PATTERN.search(content)
-    json_text = match.group(0) if match else content
-    json_text = json_text.strip().strip("`")
     try:
-        data = json.loads(json_text)
+        return load_json_object(content)
     except json.JSONDecodeError as exc:
         logger.warning(
             "Unable to parse DashScope response as JSON: {} | raw={}", exc, content
         )
         return None
-    if not isinstance(data, dict):
-        return None
-    return data
 
 
 def _apply_enrichment(
@@ -360,9 +408,11 @@ def _apply_column_enrichment(
     column_entries: Iterable[object],
     placeholder: str,
 ) -> None:
-    dim_map = {dim.expr.upper(): dim for dim in table.dimensions}
-    time_map = {td.expr.upper(): td for td in table.time_dimensions}
-    fact_map = {fact.expr.upper(): fact for fact in table.facts}
+    # One lookup per column; on an expr clash dimensions win over time
+    # dimensions, which win over facts.
+    column_map: Dict[str, Any] = {fact.expr.upper(): fact for fact in table.facts}
+    column_map.update((td.expr.upper(), td) for td in table.time_dimensions)
+    column_map.update((dim.expr.upper(), dim) for dim in table.dimensions)
 
     for entry in column_entries:
         if not isinstance(entry, dict):
@@ -371,7 +421,7 @@ def _apply_column_enrichment(
         if not isinstance(name, str):
             continue
         upper = name.upper()
-        target = dim_map.get(upper) or time_map.get(upper) or fact_map.get(upper)
+        target = column_map.get(upper)
         if not target:
             continue
 
@@ -399,17 +449,30 @@ def _apply_synonyms(
     if not clean_synonyms:
         return
 
-    existing = [
-        syn
-        for syn in getattr(target, "synonyms", [])
-        if syn.strip() and syn != placeholder
-    ]
-    merged = _deduplicate(existing + clean_synonyms)
+    container = getattr(target, "synonyms", None)
+    if container is None:
+        return
 
-    if hasattr(target, "synonyms"):
-        container = getattr(target, "synonyms")
+    existing = _deduplicate(
+        [syn for syn in container if syn.strip() and syn != placeholder]
+    )
+    # Only rebuild the repeated field when placeholders or duplicates have to
+    # go; otherwise append the new synonyms in place.
+    if len(existing) != len(container):
         del container[:]
-        container.extend(merged)
+        container.extend(existing)
+    _dedup_extend(container, clean_synonyms)
+
+
+def _dedup_extend(repeated: MutableSequence[str], items: Iterable[str]) -> None:
+    """Append ``items`` to ``repeated``, skipping case-insensitive duplicates."""
+    seen = {value.upper() for value in repeated}
+    for item in items:
+        key = item.upper()
+        if key in seen:
+            continue
+        seen.add(key)
+        repeated.append(item)
 
 
 def _deduplicate(values: Sequence[str]) -> List[str]:
@@ -672,28 +735,25 @@ def _apply_metric_enrichment(
             resolved_sources, column_type_map, aggregation, use_product
         )
 
-        metric = table.metrics.add()
-        metric.name = metric_name
-        metric.expr = expression
-
         description = entry.get("description")
-        metric.description = (
-            description.strip()
-            if isinstance(description, str) and description.strip()
-            else placeholder
-        )
-
         synonyms = entry.get("synonyms")
         synonyms_list: List[str] = []
         if isinstance(synonyms, list):
-            for syn in synonyms:
-                if isinstance(syn, (str, int, float)):
-                    text = str(syn).strip()
-                    if text:
-                        synonyms_list.append(text)
-        if not synonyms_list:
-            synonyms_list.append(name.strip())
-        metric.synonyms.extend(synonyms_list)
+            synonyms_list = [
+                str(syn).strip()
+                for syn in synonyms
+                if isinstance(syn, (str, int, float)) and str(syn).strip()
+            ]
+        table.metrics.add(
+            name=metric_name,
+            expr=expression,
+            description=(
+                description.strip()
+                if isinstance(description, str) and description.strip()
+                else placeholder
+            ),
+            synonyms=synonyms_list or [name.strip()],
+        )
 
         notes.append(
             {
@@ -717,62 +777,12 @@ def _apply_metric_enrichment(
     return None, metrics_added
 
 
-def _summarize_model_description(
-    model: semantic_model_pb2.SemanticModel,
-    client: DashscopeClient,
-    placeholder: str,
+def _apply_model_description(
+    model: semantic_model_pb2.SemanticModel, payload: Dict[str, object]
 ) -> None:
-    if model.description != placeholder and model.description.strip():
-        return
-
-    table_lines = []
-    for table in model.tables:
-        role = "fact" if table.facts or table.metrics else "dimension"
-        desc = (
-            table.description.strip() if table.description.strip() else "No description"
-        )
-        metrics = ", ".join(metric.name for metric in table.metrics) or "None"
-        table_lines.append(f"- {table.name} ({role}): {desc}. Metrics: {metrics}")
-
-    relationship_lines = []
-    for rel in model.relationships:
-        parts = [f"{rel.left_table} -> {rel.right_table}"]
-        if rel.relationship_columns:
-            columns = ", ".join(
-                f"{col.left_column}={col.right_column}"
-                for col in rel.relationship_columns
-            )
-            parts.append(f"on {columns}")
-        relationship_lines.append(" ".join(parts))
-    if not relationship_lines:
-        relationship_lines.append("No relationships provided")
-
-    messages = [
-        {
-            "role": "system",
-            "content": (
-                "You are a data modeling assistant. Given the semantic model information, "
-                "write one or two concise English sentences that describe the overall purpose of the model "
-                "and how its tables relate."
-            ),
-        },
-        {
-            "role": "user",
-            "content": (
-                f"Semantic model name: {model.name}\n"
-                f"Tables:\n{chr(10).join(table_lines)}\n"
-                f"Relationships:\n{chr(10).join(relationship_lines)}"
-            ),
-        },
-    ]
-
-    try:
-        response = client.chat_completion(messages)
-        summary = response.content.strip()
-        if summary:
-            model.description = summary
-    except DashscopeError as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to summarize semantic model description: {}", exc)
+    summary = payload.get("model_description")
+    if isinstance(summary, str) and summary.strip():
+        model.description = summary.strip()
 
 
 def _build_model_overview(
@@ -899,17 +909,164 @@ def _build_model_overview(
     return overview
 
 
-def _generate_model_metrics(
-    model: semantic_model_pb2.SemanticModel,
+def _build_model_level_prompt(
     overview: Dict[str, Any],
-    client: DashscopeClient,
-    placeholder: str,
     custom_prompt: str,
-    max_items: int = 5,
-) -> None:
+    *,
+    include_description: bool,
+    include_metrics: bool,
+    include_verified_queries: bool,
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Builds one prompt covering every model-level section that is still needed.
+
+    The static instructions come first and the model summary last so repeated
+    runs share the longest possible prompt prefix.
+    """
     if not overview.get("tables"):
-        return
+        return None
 
+    sections: List[str] = []
+    structure: List[str] = []
+    if include_description:
+        sections.append(
+            "- `model_description`: one or two concise English sentences that describe "
+            "the overall purpose of the model and how its tables relate."
+        )
+        structure.append('  "model_description": "..."')
+    if include_metrics:
+        sections.append(
+            "- `model_metrics`: up to three model-level business metrics (KPIs), each with "
+            "`name`, `expr` (for example SUM(FACT_SALES.total_amount)), `description` and `synonyms`. "
+            "Use the provided table and column names exactly; prefer SUM/AVG/COUNT-style aggregates; "
+            "avoid duplicates of existing table metrics."
+        )
+        structure.append(
+            '  "model_metrics": [{"name": "...", "expr": "...", "description": "...", "synonyms": ["..."]}]'
+        )
+    if include_verified_queries:
+        sections.append(
+            "- `verified_queries`: up to three verified analytics queries, each with `name` (short title), "
+            "`question` (business question answered) and `sql` (runnable ClickZetta SQL using FULL table paths "
+            "from base_table). Ensure every SQL statement includes an ORDER BY when needed and a LIMIT (<=200) "
+            "to keep result sets small.\n"
+            "  CRITICAL SQL Table Reference Rules:\n"
+            "  1. ALWAYS use the full path: base_table.database.base_table.schema.base_table.table\n"
+            "  2. Example: For table ORDERS with base_table {database: 'PROD_DB', schema: 'SALES', table: 'ORDERS'},\n"
+            "     use: SELECT * FROM PROD_DB.SALES.ORDERS\n"
+            "  3. DO NOT use just the logical table name (ORDERS) - this will cause 'table not found' errors\n"
+            "  4. DO NOT invent database/schema names - use EXACTLY what's in base_table"
+        )
+        structure.append(
+            '  "verified_queries": [{"name": "...", "question": "...", "sql": "..."}]'
+        )
+    if not sections:
+        return None
+
+    prompt_json = json.dumps(overview, ensure_ascii=False, indent=2)
+    instructions = (
+        "Using the semantic model summary below, return one JSON object with these keys:\n"
+        + "\n".join(sections)
+        + "\nReturn JSON with the structure:\n{\n"
+        + ",\n".join(structure)
+        + "\n}"
+    )
+    if custom_prompt.strip():
+        instructions += f"\n\nUser guidance: {custom_prompt.strip()}"
+    instructions += f"\n\nSemantic model summary:```json\n{prompt_json}\n```"
+
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are an analytics engineer and data modeling assistant for ClickZetta Lakehouse. "
+                "Only respond in JSON. "
+                "IMPORTANT - Use ClickZetta SQL syntax:\n"
+                "- Date functions: use date_add(), date_sub(), datediff() (NOT DATEADD, DATEDIFF)\n"
+                "- Date formatting: use date_format() (NOT TO_CHAR)\n"
+                "- String functions: use concat(), substring() (NOT ||, SUBSTR)\n"
+                "- Current date: use current_date(), current_timestamp() (NOT GETDATE, NOW)\n"
+                "Make sure SQL uses valid column names and respects join relationships."
+            ),
+        },
+        {"role": "user", "content": instructions},
+    ]
+
+
+def _request_model_level_completion(
+    client: DashscopeClient,
+    overview: Dict[str, Any],
+    custom_prompt: str,
+    **sections: bool,
+) -> Optional[Dict[str, object]]:
+    messages = _build_model_level_prompt(overview, custom_prompt, **sections)
+    if not messages:
+        return None
+    settings = getattr(client, "settings", None)
+    try:
+        if settings is None:
+            # Clients without settings predate the per-call budget; keep their
+            # default rather than failing the whole model-level step.
+            logger.warning(
+                "{} exposes no settings; model-level enrichment uses its default "
+                "output budget and may be truncated.",
+                type(client).__name__,
+            )
+            response = client.chat_completion(messages)
+        else:
+            response = client.chat_completion(
+                messages,
+                max_output_tokens=max(
+                    _MODEL_LEVEL_MAX_OUTPUT_TOKENS, settings.max_output_tokens
+                ),
+            )
+        return _parse_llm_response(response.content)
+    except DashscopeError as exc:
+        logger.warning("Failed to generate model-level enrichment: {}", exc)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Unexpected error generating model enrichment: {}", exc)
+    return None
+
+
+def _request_model_level_payload(
+    client: DashscopeClient,
+    overview: Dict[str, Any],
+    custom_prompt: str,
+    *,
+    include_description: bool,
+    include_metrics: bool,
+    include_verified_queries: bool,
+) -> Dict[str, object]:
+    """
+    Requests every needed model-level section in one completion, then asks for
+    each section the fused response failed to deliver (unparseable or missing
+    key) with its own prompt, so one truncated reply does not lose all three.
+    """
+    requested = {
+        "include_description": include_description,
+        "include_metrics": include_metrics,
+        "include_verified_queries": include_verified_queries,
+    }
+    payload = (
+        _request_model_level_completion(client, overview, custom_prompt, **requested)
+        or {}
+    )
+
+    for flag, key, expected_type in _MODEL_LEVEL_SECTIONS:
+        if not requested[flag] or isinstance(payload.get(key), expected_type):
+            continue
+        logger.debug("Model-level response lacked {}; requesting it separately.", key)
+        single = {name: name == flag for name in requested}
+        section_payload = _request_model_level_completion(
+            client, overview, custom_prompt, **single
+        )
+        if section_payload and key in section_payload:
+            payload[key] = section_payload[key]
+    return payload
+
+
+def _model_metrics_writable(model: semantic_model_pb2.SemanticModel) -> bool:
+    """Returns True when model-level metrics can and should be generated."""
     # Robust pre-check for metrics field accessibility
     metrics_accessible = False
 
@@ -918,7 +1075,7 @@ def _generate_model_metrics(
         logger.warning(
             "Model object missing 'metrics' attribute, skipping model-level metrics generation"
         )
-        return
+        return False
 
     # Step 2: Test basic read access
     try:
@@ -927,7 +1084,7 @@ def _generate_model_metrics(
         metrics_accessible = True
     except Exception as exc:
         logger.warning("Cannot read model.metrics field: {}", str(exc))
-        return
+        return False
 
     # Step 3: Test write access only if read access succeeded
     if metrics_accessible:
@@ -950,7 +1107,7 @@ def _generate_model_metrics(
                     current_count,
                     new_count,
                 )
-                return
+                return False
 
         except Exception as exc:
             logger.warning("Cannot write to model.metrics field: {}", str(exc))
@@ -963,7 +1120,7 @@ def _generate_model_metrics(
                 )
             except Exception:
                 pass
-            return
+            return False
 
     # Count total facts across all tables to determine if model-level metrics make sense
     total_facts = sum(len(table.facts) for table in model.tables)
@@ -971,57 +1128,22 @@ def _generate_model_metrics(
     # Skip model-level metrics only if there are no facts at all
     if total_facts < 1:
         logger.debug("Skipping model-level metrics because no facts were detected.")
-        return
+        return False
 
-    # Allow model-level metrics for most scenarios:
-    # - Multiple fact tables (cross-table metrics)
-    # - Single fact table with multiple facts (combined metrics)
-    # - Single fact table with relationships (cross-table potential)
-    # - Even single fact table without relationships (still useful for model-level aggregation)
-    # Only skip in very limited cases: no fact tables at all (handled above)
+    return True
 
-    prompt_json = json.dumps(overview, ensure_ascii=False, indent=2)
-    instructions = (
-        "Design up to three model-level business metrics (KPIs) using the semantic model summary below.\n"
-        "Return JSON with the structure:\n"
-        "{\n"
-        '  "model_metrics": [\n'
-        "    {\n"
-        '      "name": "...",\n'
-        '      "expr": "SUM(FACT_SALES.total_amount)",\n'
-        '      "description": "...",\n'
-        '      "synonyms": ["..."]\n'
-        "    }\n"
-        "  ]\n"
-        "}\n"
-        "Guidelines: use the provided table and column names exactly; prefer SUM/AVG/COUNT-style aggregates; avoid duplicates of existing table metrics."
-        f"\n\nSemantic model summary:```json\n{prompt_json}\n```"
-    )
-    if custom_prompt.strip():
-        instructions += f"\n\nUser guidance: {custom_prompt.strip()}"
-
-    messages = [
-        {
-            "role": "system",
-            "content": (
-                "You are an analytics engineer for ClickZetta Lakehouse. Only respond in JSON and propose business-friendly metrics. "
-                "Use ClickZetta SQL syntax: date_add(), date_sub(), datediff(), concat(), substring(), current_date()."
-            ),
-        },
-        {"role": "user", "content": instructions},
-    ]
-
-    response = client.chat_completion(messages)
-    payload = _parse_llm_response(response.content)
-    if not isinstance(payload, dict):
-        logger.debug("Failed to parse LLM response as dict for model metrics")
-        return
 
+def _apply_model_metrics(
+    model: semantic_model_pb2.SemanticModel,
+    payload: Dict[str, object],
+    placeholder: str,
+    max_items: int = 5,
+) -> None:
     entries = payload.get("model_metrics")
     if not isinstance(entries, list):
         logger.debug(
             "No model_metrics list found in LLM response: {}",
-            payload.keys() if payload else "None",
+            list(payload.keys()),
         )
         return
 
@@ -1046,9 +1168,28 @@ def _generate_model_metrics(
         if not isinstance(expr, str) or not expr.strip():
             continue
 
+        description = entry.get("description")
+        synonyms = entry.get("synonyms")
+        clean_synonyms: List[str] = []
+        if isinstance(synonyms, list):
+            clean_synonyms = [
+                str(item).strip()
+                for item in synonyms
+                if isinstance(item, (str, int, float)) and str(item).strip()
+            ]
+
         # Add metric with additional safety check
         try:
-            metric = model.metrics.add()
+            model.metrics.add(
+                name=_sanitize_metric_name(name, existing_names),
+                expr=expr.strip().rstrip(";"),
+                description=(
+                    description.strip()
+                    if isinstance(description, str) and description.strip()
+                    else placeholder
+                ),
+                synonyms=clean_synonyms or [name.strip()],
+            )
         except Exception as exc:
             logger.warning(
                 "Failed to add model-level metric '{}' despite pre-check: {}",
@@ -1060,27 +1201,6 @@ def _generate_model_metrics(
             )
             return
 
-        metric.name = _sanitize_metric_name(name, existing_names)
-        metric.expr = expr.strip().rstrip(";")
-
-        description = entry.get("description")
-        if isinstance(description, str) and description.strip():
-            metric.description = description.strip()
-        else:
-            metric.description = placeholder
-
-        synonyms = entry.get("synonyms")
-        if isinstance(synonyms, list):
-            clean_synonyms = [
-                str(item).strip()
-                for item in synonyms
-                if isinstance(item, (str, int, float)) and str(item).strip()
-            ]
-            if clean_synonyms:
-                metric.synonyms.extend(clean_synonyms)
-
-        if not metric.synonyms:
-            metric.synonyms.append(name.strip())
         added += 1
 
 
@@ -1102,60 +1222,25 @@ def _ensure_limit_clause(sql: str, default_limit: int = 200) -> str:
     return f"{normalized} LIMIT {default_limit}"
 
 
-def _generate_verified_queries(
-    model: semantic_model_pb2.SemanticModel,
-    overview: Dict[str, Any],
-    client: DashscopeClient,
-    placeholder: str,
-    custom_prompt: str,
-    session: Optional[Session] = None,
-    max_items: int = 3,
-) -> None:
-    if session is None:
-        logger.debug(
-            "Skipping verified query generation because no ClickZetta session was provided."
+def _validate_verified_query(session: Session, query_name: str, sql: str) -> bool:
+    try:
+        session.sql(sql).to_pandas()
+    except Exception as exc:  # pragma: no cover - ClickZetta query failed
+        logger.warning(
+            "Skipping verified query '{}' due to validation failure: {}",
+            query_name,
+            exc,
         )
-        return
+        return False
+    return True
 
-    prompt_json = json.dumps(overview, ensure_ascii=False, indent=2)
-    instructions = (
-        "Propose up to three verified analytics queries for the semantic model below. Each query must include:\n"
-        "- `name`: short title\n"
-        "- `question`: business question answered\n"
-        "- `sql`: runnable ClickZetta SQL using FULL table paths from base_table\n"
-        "CRITICAL SQL Table Reference Rules:\n"
-        "1. ALWAYS use the full path: base_table.database.base_table.schema.base_table.table\n"
-        "2. Example: For table ORDERS with base_table {database: 'PROD_DB', schema: 'SALES', table: 'ORDERS'},\n"
-        "   use: SELECT * FROM PROD_DB.SALES.ORDERS\n"
-        "3. DO NOT use just the logical table name (ORDERS) - this will cause 'table not found' errors\n"
-        "4. DO NOT invent database/schema names - use EXACTLY what's in base_table\n"
-        "Return JSON with `verified_queries`. Ensure every SQL statement includes an ORDER BY when needed and a LIMIT (<=200) to keep result sets small."
-        f"\n\nSemantic model summary:```json\n{prompt_json}\n```"
-    )
-    if custom_prompt.strip():
-        instructions += f"\n\nUser guidance: {custom_prompt.strip()}"
-
-    messages = [
-        {
-            "role": "system",
-            "content": (
-                "You create example analytical queries for ClickZetta Lakehouse. Return JSON only. "
-                "IMPORTANT - Use ClickZetta SQL syntax:\n"
-                "- Date functions: use date_add(), date_sub(), datediff() (NOT DATEADD, DATEDIFF)\n"
-                "- Date formatting: use date_format() (NOT TO_CHAR)\n"
-                "- String functions: use concat(), substring() (NOT ||, SUBSTR)\n"
-                "- Current date: use current_date(), current_timestamp() (NOT GETDATE, NOW)\n"
-                "Make sure SQL uses valid column names and respects join relationships."
-            ),
-        },
-        {"role": "user", "content": instructions},
-    ]
-
-    response = client.chat_completion(messages)
-    payload = _parse_llm_response(response.content)
-    if not isinstance(payload, dict):
-        return
 
+def _apply_verified_queries(
+    model: semantic_model_pb2.SemanticModel,
+    payload: Dict[str, object],
+    session: Session,
+    max_items: int = 3,
+) -> None:
     entries = payload.get("verified_queries")
     if not isinstance(entries, list):
         return
@@ -1163,6 +1248,7 @@ def _generate_verified_queries(
     existing_names = {vq.name.lower() for vq in model.verified_queries}
     existing_sql = {vq.sql.strip().lower() for vq in model.verified_queries}
 
+    candidates: List[Tuple[Dict[str, Any], str, str]] = []
     for entry in entries[:max_items]:
         if not isinstance(entry, dict):
             continue
@@ -1179,19 +1265,33 @@ def _generate_verified_queries(
             )
 
         normalized_sql = _ensure_limit_clause(sql)
-        if normalized_sql.strip().lower() in existing_sql:
+        sql_key = normalized_sql.strip().lower()
+        if sql_key in existing_sql:
             continue
+        existing_sql.add(sql_key)
+        candidates.append((entry, query_name, normalized_sql))
 
-        try:
-            session.sql(normalized_sql).to_pandas()
-        except Exception as exc:  # pragma: no cover - ClickZetta query failed
-            logger.warning(
-                "Skipping verified query '{}' due to validation failure: {}",
-                query_name,
-                exc,
+    if not candidates:
+        return
+
+    # Each validation is a ClickZetta round-trip; run them concurrently and
+    # append the passing queries in the order the LLM proposed them.
+    with ThreadPoolExecutor(
+        max_workers=min(_VERIFIED_QUERY_VALIDATION_MAX_WORKERS, len(candidates))
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda candidate: _validate_verified_query(
+                    session, candidate[1], candidate[2]
+                ),
+                candidates,
             )
-            continue
+        )
 
+    for (entry, query_name, normalized_sql), is_valid in zip(candidates, results):
+        if not is_valid:
+            continue
+        question = entry.get("question")
         verified_query = model.verified_queries.add()
         verified_query.name = _sanitize_query_name(query_name, existing_names)
         if isinstance(question, str) and question.strip():
@@ -1207,5 +1307,3 @@ def _generate_verified_queries(
         use_as_onboarding = entry.get("use_as_onboarding_question")
         if isinstance(use_as_onboarding, bool):
             verified_query.use_as_onboarding_question = use_as_onboarding
-
-        existing_sql.add(normalized_sql.strip().lower())
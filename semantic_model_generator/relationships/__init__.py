@@ -6,6 +6,7 @@ from .discovery import (
     discover_relationships_from_schema,
     discover_relationships_from_table_definitions,
     discover_relationships_from_tables,
+    invalidate_schema_cache,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "discover_relationships_from_schema",
     "discover_relationships_from_table_definitions",
     "discover_relationships_from_tables",
+    "invalidate_schema_cache",
 ]
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
@@ -26,6 +31,19 @@ except Exception:  # pragma: no cover
     Session = Any  # type: ignore
 
 DEFAULT_MAX_WORKERS = 4
+# Column metadata is only cached when a caller opts in with
+# ``metadata_cache_ttl_seconds``; at most this many scopes are kept per session.
+SCHEMA_METADATA_CACHE_MAX_ENTRIES = 64
+
+_SchemaCacheKey = Tuple[str, str, Optional[Tuple[str, ...]]]
+# scope -> (fetched_at, metadata_df)
+_SchemaCacheEntries = OrderedDict[_SchemaCacheKey, Tuple[float, pd.DataFrame]]
+# One LRU (least recently used first) per session. Weak keys scope entries to
+# the connection that fetched them and drop them once that session is gone.
+_SCHEMA_METADATA_CACHE: weakref.WeakKeyDictionary[
+    Any, _SchemaCacheEntries
+] = weakref.WeakKeyDictionary()
+_SCHEMA_METADATA_CACHE_LOCK = threading.Lock()
 
 
 @dataclass
@@ -65,6 +83,94 @@ def _normalize_table_names(table_names: Optional[Iterable[str]]) -> Optional[Lis
     return normalized
 
 
+def invalidate_schema_cache(session: Optional[Session] = None) -> None:
+    """
+    Drops cached column metadata for ``session`` (or for every session), e.g.
+    after DDL changes a schema.
+    """
+    with _SCHEMA_METADATA_CACHE_LOCK:
+        if session is None:
+            _SCHEMA_METADATA_CACHE.clear()
+        else:
+            _SCHEMA_METADATA_CACHE.pop(session, None)
+
+
+def _evict_expired_schema_metadata(
+    entries: _SchemaCacheEntries, now: float, ttl_seconds: float
+) -> None:
+    """Drops expired entries; the caller must hold ``_SCHEMA_METADATA_CACHE_LOCK``."""
+    expired = [
+        key
+        for key, (fetched_at, _) in entries.items()
+        if now - fetched_at >= ttl_seconds
+    ]
+    for key in expired:
+        del entries[key]
+
+
+def _query_columns_df(
+    session: Session,
+    workspace: str,
+    schema: str,
+    table_names: Optional[List[str]],
+) -> pd.DataFrame:
+    metadata_df = get_valid_schemas_tables_columns_df(
+        session=session,
+        workspace=workspace,
+        table_schema=schema,
+        table_names=table_names,
+    )
+    metadata_df.columns = [str(col).upper() for col in metadata_df.columns]
+    return metadata_df
+
+
+def _fetch_columns_df(
+    session: Session,
+    workspace: str,
+    schema: str,
+    table_names: Optional[List[str]],
+    ttl_seconds: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Returns column metadata for the scope.
+
+    Without ``ttl_seconds`` every call queries information_schema and returns
+    that frame as is, with no copy; discovery only derives new frames from it.
+    With it, a result this session fetched for the same (case-insensitive)
+    workspace, schema and tables within the TTL is reused; cached frames are
+    private, so storing and each hit copy the frame.
+    """
+    if not ttl_seconds:
+        return _query_columns_df(session, workspace, schema, table_names)
+
+    key: _SchemaCacheKey = (
+        workspace.upper(),
+        schema.upper(),
+        tuple(name.upper() for name in table_names) if table_names else None,
+    )
+    now = time.monotonic()
+    with _SCHEMA_METADATA_CACHE_LOCK:
+        try:
+            entries = _SCHEMA_METADATA_CACHE.setdefault(session, OrderedDict())
+        except TypeError:  # session cannot be weakly referenced; skip caching
+            entries = None
+        if entries is not None:
+            _evict_expired_schema_metadata(entries, now, ttl_seconds)
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                return cached[1].copy()
+
+    metadata_df = _query_columns_df(session, workspace, schema, table_names)
+    if entries is not None and not metadata_df.empty:
+        with _SCHEMA_METADATA_CACHE_LOCK:
+            entries[key] = (now, metadata_df.copy())
+            entries.move_to_end(key)
+            while len(entries) > SCHEMA_METADATA_CACHE_MAX_ENTRIES:
+                entries.popitem(last=False)
+    return metadata_df
+
+
 def _apply_key_prefilter(metadata_df: pd.DataFrame) -> pd.DataFrame:
     """Stage 0: keep only join-key-candidate columns before sampling/profiling.
 
@@ -102,13 +208,10 @@ def _apply_key_prefilter(metadata_df: pd.DataFrame) -> pd.DataFrame:
 
     # Safety: never let a table disappear entirely due to filtering.
     if _TABLE_NAME_COL in metadata_df.columns:
-        kept_tables = set(filtered[_TABLE_NAME_COL].astype(str).str.upper())
-        all_tables = set(metadata_df[_TABLE_NAME_COL].astype(str).str.upper())
-        missing = all_tables - kept_tables
+        table_keys = metadata_df[_TABLE_NAME_COL].astype(str).str.upper()
+        missing = set(table_keys) - set(table_keys[mask])
         if missing:
-            rescue = metadata_df[
-                metadata_df[_TABLE_NAME_COL].astype(str).str.upper().isin(missing)
-            ]
+            rescue = metadata_df[table_keys.isin(missing)]
             filtered = pd.concat([filtered, rescue], ignore_index=True)
 
     return filtered if not filtered.empty else metadata_df
@@ -134,12 +237,14 @@ def _build_tables_from_dataframe(
     table_order = (
         columns_df[_TABLE_NAME_COL].astype(str).str.upper().drop_duplicates().tolist()
     )
+    columns_by_table = {
+        name: group for name, group in columns_df.groupby(_TABLE_NAME_COL, sort=False)
+    }
 
-    tables: List[Tuple[FQNParts, Table]] = []
-    for idx, table_name in enumerate(table_order):
-        table_columns_df = columns_df[columns_df[_TABLE_NAME_COL] == table_name]
-        if table_columns_df.empty:
-            continue
+    def _build_table(idx: int, table_name: str) -> Optional[Tuple[FQNParts, Table]]:
+        table_columns_df = columns_by_table.get(table_name)
+        if table_columns_df is None or table_columns_df.empty:
+            return None
 
         max_workers_for_table = min(max_workers, len(table_columns_df.index) or 1)
         table_proto = get_table_representation(
@@ -152,14 +257,21 @@ def _build_tables_from_dataframe(
             columns_df=table_columns_df,
             max_workers=max_workers_for_table,
         )
-        tables.append(
-            (
-                FQNParts(database=workspace, schema_name=schema, table=table_name),
-                table_proto,
-            )
+        return (
+            FQNParts(database=workspace, schema_name=schema, table=table_name),
+            table_proto,
+        )
+
+    # Each table costs at least one sampling round-trip; overlap them instead of
+    # paying the latency once per table.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(table_order)))
+    ) as executor:
+        built = list(
+            executor.map(_build_table, range(len(table_order)), table_order)
         )
 
-    return tables
+    return [entry for entry in built if entry is not None]
 
 
 def _tables_payload_to_raw_tables(
@@ -216,12 +328,16 @@ def _tables_payload_to_raw_tables(
                     f"Column definition for table '{table_name}' must be a mapping"
                 )
 
-            column_name = str(
-                column_entry.get("name")
-                or column_entry.get("column_name")
-                or column_entry.get("field")
-                or ""
-            ).strip()
+            # Names recur across every table and relationship pair; interning
+            # lets later equality/hash checks short-circuit on identity.
+            column_name = sys.intern(
+                str(
+                    column_entry.get("name")
+                    or column_entry.get("column_name")
+                    or column_entry.get("field")
+                    or ""
+                ).strip()
+            )
             if not column_name:
                 raise ValueError(
                     f"Column definition in table '{table_name}' missing 'name'"
@@ -258,7 +374,7 @@ def _tables_payload_to_raw_tables(
 
         table_proto = Table(
             id_=table_index,
-            name=table_name.upper(),
+            name=sys.intern(table_name.upper()),
             columns=columns,
             comment=table_entry.get("comment"),
         )
@@ -398,6 +514,7 @@ def discover_relationships_from_schema(
     timeout_seconds: Optional[float] = 30.0,
     max_tables: Optional[int] = 60,
     key_prefilter: bool = False,
+    metadata_cache_ttl_seconds: Optional[float] = None,
 ) -> RelationshipDiscoveryResult:
     """
     Discover table relationships for all tables in a ClickZetta schema.
@@ -409,16 +526,16 @@ def discover_relationships_from_schema(
     per-column sampling down to the few key-like columns. Defaults to False to
     preserve existing behavior; flip on and compare with the precision/recall
     harness before making it the default.
+
+    ``metadata_cache_ttl_seconds``: when set, column metadata this session
+    fetched for the same scope within that many seconds is reused instead of
+    querying information_schema again. Off by default so DDL is seen at once.
     """
     normalized_tables = _normalize_table_names(table_names)
 
-    metadata_df = get_valid_schemas_tables_columns_df(
-        session=session,
-        workspace=workspace,
-        table_schema=schema,
-        table_names=normalized_tables,
+    metadata_df = _fetch_columns_df(
+        session, workspace, schema, normalized_tables, metadata_cache_ttl_seconds
     )
-    metadata_df.columns = [str(col).upper() for col in metadata_df.columns]
 
     if key_prefilter and not metadata_df.empty:
         metadata_df = _apply_key_prefilter(metadata_df)
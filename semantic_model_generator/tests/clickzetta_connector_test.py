@@ -1,15 +1,15 @@
-from importlib import reload
 from unittest import mock
 
 import pandas as pd
+from clickzetta.zettapark.row import Row
 
 from semantic_model_generator.clickzetta_utils import clickzetta_connector as connector
 from semantic_model_generator.clickzetta_utils import env_vars
 
 
 def test_fetch_stages_includes_user_volume(monkeypatch):
-    data = pd.DataFrame({"name": ["shared_stage"]})
-    with mock.patch.object(connector, "_execute_query_to_pandas", return_value=data):
+    data = (["name"], [("shared_stage",)])
+    with mock.patch.object(connector, "_execute_query_to_rows", return_value=data):
         stages = connector.fetch_stages_in_schema(
             connection=mock.MagicMock(), schema_name="WORKSPACE.SCHEMA"
         )
@@ -17,6 +17,38 @@ def test_fetch_stages_includes_user_volume(monkeypatch):
     assert "shared_stage" in stages
 
 
+def _sql_session(records, names):
+    result = mock.MagicMock()
+    result.collect.return_value = records
+    result.schema.names = names
+    session = mock.MagicMock(spec=["sql"])
+    session.sql.return_value = result
+    return session
+
+
+def test_execute_query_to_rows_reads_names_from_rows():
+    session = _sql_session([Row(name="stage_a", kind="EXTERNAL")], ["ignored"])
+
+    columns, rows = connector._execute_query_to_rows(session, "SHOW VOLUMES")
+
+    assert columns == ["name", "kind"]
+    assert rows == [("stage_a", "EXTERNAL")]
+
+
+def test_execute_query_to_rows_uses_schema_for_empty_and_plain_rows():
+    empty = _sql_session([], ["name", "kind"])
+    assert connector._execute_query_to_rows(empty, "SHOW VOLUMES") == (
+        ["name", "kind"],
+        [],
+    )
+
+    plain = _sql_session([("stage_a", "EXTERNAL")], ["name", "kind"])
+    assert connector._execute_query_to_rows(plain, "SHOW VOLUMES") == (
+        ["name", "kind"],
+        [("stage_a", "EXTERNAL")],
+    )
+
+
 def test_fetch_yaml_names_in_user_volume(monkeypatch):
     data = pd.DataFrame(
         {
@@ -36,20 +68,39 @@ def test_fetch_yaml_names_in_user_volume(monkeypatch):
     assert files == ["example.yaml", "duplicate.yaml"]
 
 
-def test_build_base_connection_config_includes_hints(monkeypatch):
-    monkeypatch.setenv("CLICKZETTA_SERVICE", "svc")
-    monkeypatch.setenv("CLICKZETTA_INSTANCE", "inst")
-    monkeypatch.setenv("CLICKZETTA_WORKSPACE", "ws")
-    monkeypatch.setenv("CLICKZETTA_SCHEMA", "PUBLIC")
-    monkeypatch.setenv("CLICKZETTA_USERNAME", "user")
-    monkeypatch.setenv("CLICKZETTA_PASSWORD", "secret")
-
-    reload(env_vars)
-    config = env_vars.build_base_connection_config()
+def test_build_base_connection_config_includes_hints():
+    config = env_vars.build_base_connection_config(
+        {
+            "CLICKZETTA_SERVICE": "svc",
+            "CLICKZETTA_INSTANCE": "inst",
+            "CLICKZETTA_WORKSPACE": "ws",
+            "CLICKZETTA_SCHEMA": "PUBLIC",
+            "CLICKZETTA_USERNAME": "user",
+            "CLICKZETTA_PASSWORD": "secret",
+        }
+    )
     assert config["service"] == "svc"
+    assert config["schema"] == "PUBLIC"
     assert "hints" in config
 
 
+def test_assert_required_env_vars_reads_the_given_environment(monkeypatch):
+    monkeypatch.setattr(env_vars, "CONFIG_CONNECTION", None)
+    environ = {
+        "CLICKZETTA_SERVICE": "svc",
+        "CLICKZETTA_INSTANCE": "inst",
+        "CLICKZETTA_WORKSPACE": "ws",
+        "CLICKZETTA_USERNAME": "user",
+    }
+
+    assert env_vars.assert_required_env_vars(environ) == [
+        "CLICKZETTA_SCHEMA",
+        "CLICKZETTA_PASSWORD",
+    ]
+    environ.update(CLICKZETTA_SCHEMA="PUBLIC", CLICKZETTA_PASSWORD="secret")
+    assert env_vars.assert_required_env_vars(environ) == []
+
+
 def test_get_valid_columns_falls_back_to_show_columns():
     class DummyResult:
         def __init__(self, df: pd.DataFrame):
@@ -73,7 +124,7 @@ def test_get_valid_columns_falls_back_to_show_columns():
         raise Exception("information_schema unavailable")
 
     session = mock.MagicMock()
-    connector._CATALOG_CATEGORY_CACHE.clear()
+    connector._clear_catalog_category_cache()
     with mock.patch.object(connector, "_catalog_category", return_value="SHARED"):
         session.sql.side_effect = sql_side_effect
 
@@ -118,7 +169,7 @@ def test_get_valid_columns_handles_fully_qualified_filters():
 
     session = mock.MagicMock()
     session.sql.side_effect = sql_side_effect
-    connector._CATALOG_CATEGORY_CACHE.clear()
+    connector._clear_catalog_category_cache()
 
     df = connector.get_valid_schemas_tables_columns_df(
         session=session,
@@ -160,7 +211,7 @@ def test_fetch_tables_views_in_schema_shared_catalog_does_not_use_share_clause()
 
     session = mock.MagicMock()
     session.sql.side_effect = sql_side_effect
-    connector._CATALOG_CATEGORY_CACHE.clear()
+    connector._clear_catalog_category_cache()
 
     with mock.patch.object(connector, "_catalog_category", return_value="SHARED"):
         tables = connector.fetch_tables_views_in_schema(
@@ -169,3 +220,139 @@ def test_fetch_tables_views_in_schema_shared_catalog_does_not_use_share_clause()
 
     assert tables == ["lakehouse_ai.schema_for_opencatalog.czcustomer"]
     assert all("IN SHARE" not in query for query in executed_queries)
+
+
+def test_get_valid_columns_only_falls_back_for_missing_tables():
+    class DummyResult:
+        def __init__(self, df: pd.DataFrame):
+            self._df = df
+
+        def to_pandas(self) -> pd.DataFrame:
+            return self._df
+
+    info_df = pd.DataFrame(
+        {
+            "table_schema": ["S1"],
+            "table_name": ["TABLE_ONE"],
+            "column_name": ["ID"],
+            "data_type": ["INT"],
+            "column_comment": [""],
+            "table_comment": [""],
+            "is_primary_key": [True],
+        }
+    )
+    show_df = pd.DataFrame(
+        {
+            "schema_name": ["S1"],
+            "table_name": ["TABLE_TWO"],
+            "column_name": ["NAME"],
+            "data_type": ["STRING"],
+            "comment": [""],
+        }
+    )
+
+    call_log: list[str] = []
+
+    def sql_side_effect(query: str):
+        call_log.append(query)
+        if "information_schema" in query:
+            return DummyResult(info_df)
+        if query == "SHOW COLUMNS IN TEST_WS.S1.TABLE_TWO":
+            return DummyResult(show_df)
+        raise RuntimeError("unsupported query")
+
+    session = mock.MagicMock()
+    session.sql.side_effect = sql_side_effect
+    connector._clear_catalog_category_cache()
+
+    df = connector.get_valid_schemas_tables_columns_df(
+        session=session,
+        workspace="TEST_WS",
+        table_schema="S1",
+        table_names=["TABLE_ONE", "TEST_WS.S1.TABLE_TWO", "TABLE_ONE"],
+    )
+
+    assert sorted(df["TABLE_NAME"].tolist()) == ["TABLE_ONE", "TABLE_TWO"]
+    info_queries = [q for q in call_log if "information_schema" in q]
+    assert len(info_queries) == 1
+    assert "IN ('TABLE_ONE', 'TABLE_TWO')" in info_queries[0]
+    assert not any("SHOW COLUMNS IN TEST_WS.S1.TABLE_ONE" in q for q in call_log)
+
+
+def test_get_valid_columns_falls_back_per_schema_for_shared_table_names():
+    class DummyResult:
+        def __init__(self, df: pd.DataFrame):
+            self._df = df
+
+        def to_pandas(self) -> pd.DataFrame:
+            return self._df
+
+    info_df = pd.DataFrame(
+        {
+            "table_schema": ["S1"],
+            "table_name": ["T"],
+            "column_name": ["ID"],
+            "data_type": ["INT"],
+            "column_comment": [""],
+            "table_comment": [""],
+            "is_primary_key": [True],
+        }
+    )
+    show_df = pd.DataFrame(
+        {
+            "schema_name": ["S2"],
+            "table_name": ["T"],
+            "column_name": ["NAME"],
+            "data_type": ["STRING"],
+            "comment": [""],
+        }
+    )
+
+    call_log: list[str] = []
+
+    def sql_side_effect(query: str):
+        call_log.append(query)
+        if "information_schema" in query:
+            return DummyResult(info_df)
+        if query == "SHOW COLUMNS IN TEST_WS.S2.T":
+            return DummyResult(show_df)
+        raise RuntimeError("unsupported query")
+
+    session = mock.MagicMock()
+    session.sql.side_effect = sql_side_effect
+    connector._clear_catalog_category_cache()
+
+    df = connector.get_valid_schemas_tables_columns_df(
+        session=session,
+        workspace="TEST_WS",
+        table_schema="S1",
+        table_names=["S1.T", "S2.T", "s2.t"],
+    )
+
+    assert sorted(zip(df["TABLE_SCHEMA"], df["TABLE_NAME"])) == [
+        ("S1", "T"),
+        ("S2", "T"),
+    ]
+    show_queries = [q for q in call_log if q.startswith("SHOW COLUMNS")]
+    assert show_queries == ["SHOW COLUMNS IN TEST_WS.S2.T"]
+
+
+def test_catalog_category_is_cached_per_workspace_across_sessions():
+    catalogs = pd.DataFrame({"name": ["TEST_WS"], "category": ["shared"]})
+    first, second = mock.MagicMock(), mock.MagicMock()
+    for session in (first, second):
+        session.sql.return_value.to_pandas.return_value = catalogs
+    connector._clear_catalog_category_cache()
+
+    assert connector._catalog_category(first, "test_ws") == "SHARED"
+    assert connector._catalog_category(second, "TEST_WS") == "SHARED"
+
+    assert first.sql.call_count == 1
+    assert second.sql.call_count == 0
+    # Keyed on the workspace alone, so no session is retained.
+    assert connector._catalog_category_slot.cache_info().currsize == 1
+    assert connector._catalog_category_slot("TEST_WS") == {"category": "SHARED"}
+
+    connector._clear_catalog_category_cache()
+    assert connector._catalog_category(second, "TEST_WS") == "SHARED"
+    assert second.sql.call_count == 1
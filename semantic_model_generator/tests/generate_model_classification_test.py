@@ -52,12 +52,12 @@ def test_string_date_promoted_to_time_dimension() -> None:
         raw_table=raw_table,
     )
 
-    time_dimension_names = {td.name for td in table.time_dimensions}
+    time_dimensions = {td.name: td for td in table.time_dimensions}
     dimension_names = {dim.name for dim in table.dimensions}
 
-    assert "order_date" in time_dimension_names
+    assert "order_date" in time_dimensions
     assert "order_date" not in dimension_names
-    time_dim = next(td for td in table.time_dimensions if td.name == "order_date")
+    time_dim = time_dimensions["order_date"]
     assert time_dim.data_type == "TIMESTAMP_NTZ"
 
 
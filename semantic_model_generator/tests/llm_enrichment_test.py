@@ -1,30 +1,98 @@
 import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from types import SimpleNamespace
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 from semantic_model_generator.data_processing.data_types import Column, FQNParts, Table
-from semantic_model_generator.llm.dashscope_client import DashscopeResponse
-from semantic_model_generator.llm.enrichment import enrich_semantic_model
+from semantic_model_generator.llm import dashscope_client
+from semantic_model_generator.llm.dashscope_client import (
+    CachedDashscopeClient,
+    DashscopeClient,
+    DashscopeResponse,
+    DashscopeSettings,
+)
+from semantic_model_generator.llm.enrichment import (
+    _MODEL_LEVEL_MAX_OUTPUT_TOKENS,
+    _parse_llm_response,
+    _request_model_level_payload,
+    enrich_semantic_model,
+)
 from semantic_model_generator.protos import semantic_model_pb2
 
 
+_TABLE_NAME_PATTERN = re.compile(r'"table_name": "([^"]+)"')
+
+
+def _classify_prompt(messages) -> str:  # type: ignore[no-untyped-def]
+    """Maps an enrichment prompt to the payload key it should be answered with."""
+    content = "\n".join(message["content"] for message in messages)
+    if "Semantic model summary:" in content:
+        return "model"
+    match = _TABLE_NAME_PATTERN.search(content)
+    return match.group(1) if match else ""
+
+
+def _by_expr(items):  # type: ignore[no-untyped-def]
+    return {item.expr: item for item in items}
+
+
+def _by_name(items):  # type: ignore[no-untyped-def]
+    return {item.name: item for item in items}
+
+
+def _make_response(payload, request_id):  # type: ignore[no-untyped-def]
+    content = (
+        orjson.dumps(payload).decode()
+        if orjson is not None
+        else json.dumps(payload, ensure_ascii=False)
+    )
+    return DashscopeResponse(content=content, request_id=request_id)
+
+
 class _FakeDashscopeClient:
+    """
+    Returns canned responses. A dict of payloads is keyed by ``_classify_prompt``
+    (table name, or ``model`` for the fused model-level prompt) so call order
+    does not matter; a list is served in call order.
+    """
+
+    settings = DashscopeSettings(api_key="test", model="test")
+
     def __init__(self, payloads):
-        if isinstance(payloads, list):
-            self._payloads = payloads
+        # Responses are immutable, so serialize every payload once up front.
+        if isinstance(payloads, dict):
+            self._responses = {
+                key: _make_response(payload, f"test_{key}")
+                for key, payload in payloads.items()
+            }
         else:
-            self._payloads = [payloads]
+            if not isinstance(payloads, list):
+                payloads = [payloads]
+            self._responses = [
+                _make_response(payload, f"test_{index + 1}")
+                for index, payload in enumerate(payloads)
+            ]
         self._index = 0
+        self._lock = threading.Lock()
 
-    def chat_completion(self, messages):  # type: ignore[no-untyped-def]
-        payload = (
-            self._payloads[self._index]
-            if self._index < len(self._payloads)
-            else self._payloads[-1]
-        )
-        self._index += 1
-        return DashscopeResponse(
-            content=json.dumps(payload, ensure_ascii=False),
-            request_id=f"test_{self._index}",
-        )
+    def chat_completion(self, messages, max_output_tokens=None):  # type: ignore[no-untyped-def]
+        with self._lock:
+            self._index += 1
+            if isinstance(self._responses, dict):
+                key = _classify_prompt(messages)
+                if key not in self._responses:
+                    raise KeyError(f"No fake payload for prompt kind {key!r}")
+                return self._responses[key]
+            return self._responses[min(self._index, len(self._responses)) - 1]
 
 
 def test_enrich_semantic_model_populates_descriptions_and_synonyms() -> None:
@@ -126,7 +194,10 @@ def test_enrich_semantic_model_populates_descriptions_and_synonyms() -> None:
     }
 
     client = _FakeDashscopeClient(
-        [fake_response, {"model_metrics": []}, {"verified_queries": []}]
+        {
+            "ORDERS": fake_response,
+            "model": {"model_metrics": []},
+        }
     )
     enrich_semantic_model(
         model,
@@ -141,27 +212,25 @@ def test_enrich_semantic_model_populates_descriptions_and_synonyms() -> None:
         == "Orders fact table that records order status and total amount."
     )
 
-    dimension = next(dim for dim in table.dimensions if dim.expr == "order_status")
+    dimension = _by_expr(table.dimensions)["order_status"]
     assert dimension.description == "Current execution status for each order."
-    assert "Order status" in list(dimension.synonyms)
+    assert "Order status" in dimension.synonyms
 
-    fact = next(f for f in table.facts if f.expr == "total_amount")
+    fact = _by_expr(table.facts)["total_amount"]
     assert fact.description == "Order total including taxes."
-    assert "Order total" in list(fact.synonyms)
+    assert "Order total" in fact.synonyms
 
-    filter_obj = next(
-        flt for flt in table.filters if flt.name == "order_status_include_values"
-    )
+    filter_obj = _by_name(table.filters)["order_status_include_values"]
     assert (
         filter_obj.description == "Limit the result set to a sample of order statuses."
     )
-    assert "Order status filter" in list(filter_obj.synonyms)
+    assert "Order status filter" in filter_obj.synonyms
 
     assert len(table.metrics) == 1
     metric = table.metrics[0]
     assert metric.name.startswith("gmv")
     assert metric.expr == "SUM(total_amount)"
-    assert "GMV" in list(metric.synonyms)
+    assert "GMV" in metric.synonyms
     assert (
         metric.description
         == "Based on total_amount and used as gross merchandise value."
@@ -181,9 +250,11 @@ class _FakeSession:
 
     def __init__(self) -> None:
         self.queries: list[str] = []
+        self._lock = threading.Lock()
 
     def sql(self, query):  # type: ignore[no-untyped-def]
-        self.queries.append(query)
+        with self._lock:
+            self.queries.append(query)
         return _FakeSession._Result()
 
 
@@ -279,7 +350,7 @@ def test_enrich_semantic_model_generates_model_metrics_and_verified_queries() ->
         "filters": [],
     }
 
-    model_metrics_payload = {
+    model_payload = {
         "model_metrics": [
             {
                 "name": "Total revenue",
@@ -287,10 +358,7 @@ def test_enrich_semantic_model_generates_model_metrics_and_verified_queries() ->
                 "description": "Sum of total_amount across all orders.",
                 "synonyms": ["Revenue"],
             }
-        ]
-    }
-
-    verified_queries_payload = {
+        ],
         "verified_queries": [
             {
                 "name": "Recent orders",
@@ -298,22 +366,16 @@ def test_enrich_semantic_model_generates_model_metrics_and_verified_queries() ->
                 "sql": "SELECT order_id, total_amount FROM ORDERS ORDER BY order_id DESC",
                 "use_as_onboarding_question": True,
             }
-        ]
+        ],
+        "model_description": "This is an orders model for tracking sales and payments.",
     }
 
-    # Model description response for when _summarize_model_description is called
-    model_description_payload = (
-        "This is an orders model for tracking sales and payments."
-    )
-
     client = _FakeDashscopeClient(
-        [
-            table_payload,
-            table_payload_payments,
-            model_description_payload,
-            model_metrics_payload,
-            verified_queries_payload,
-        ]
+        {
+            "ORDERS": table_payload,
+            "PAYMENTS": table_payload_payments,
+            "model": model_payload,
+        }
     )
     session = _FakeSession()
 
@@ -339,7 +401,7 @@ def test_enrich_semantic_model_generates_model_metrics_and_verified_queries() ->
     metric = model.metrics[0]
     assert metric.expr == "SUM(ORDERS.total_amount)"
     assert metric.description == "Sum of total_amount across all orders."
-    assert "Revenue" in list(metric.synonyms)
+    assert "Revenue" in metric.synonyms
 
     # Verified queries validated and appended
     assert len(model.verified_queries) == 1
@@ -350,6 +412,12 @@ def test_enrich_semantic_model_generates_model_metrics_and_verified_queries() ->
     assert verified.verified_by
     assert session.queries and session.queries[0] == verified.sql
 
+    # Description, metrics and queries come from one model-level completion
+    assert (
+        model.description == "This is an orders model for tracking sales and payments."
+    )
+    assert client._index == 3
+
 
 def test_model_metrics_generated_with_single_fact_table() -> None:
     raw_orders = Table(
@@ -393,7 +461,7 @@ def test_model_metrics_generated_with_single_fact_table() -> None:
         "filters": [],
     }
 
-    model_metrics_payload = {
+    model_payload = {
         "model_metrics": [
             {
                 "name": "Total Order Value",
@@ -401,21 +469,16 @@ def test_model_metrics_generated_with_single_fact_table() -> None:
                 "description": "Total value across all orders.",
                 "synonyms": ["Revenue"],
             }
-        ]
+        ],
+        "verified_queries": [],
+        "model_description": "This is an orders model for tracking order metrics.",
     }
 
-    verified_queries_payload = {"verified_queries": []}
-
-    # Model description response for when _summarize_model_description is called
-    model_description_payload = "This is an orders model for tracking order metrics."
-
     client = _FakeDashscopeClient(
-        [
-            table_payload,
-            model_description_payload,
-            model_metrics_payload,
-            verified_queries_payload,
-        ]
+        {
+            "ORDERS": table_payload,
+            "model": model_payload,
+        }
     )
     session = _FakeSession()
 
@@ -437,7 +500,7 @@ def test_model_metrics_generated_with_single_fact_table() -> None:
     metric = model.metrics[0]
     assert metric.expr == "SUM(ORDERS.total_amount)"
     assert metric.description == "Total value across all orders."
-    assert "Revenue" in list(metric.synonyms)
+    assert "Revenue" in metric.synonyms
 
 
 def test_model_metrics_skipped_with_no_facts() -> None:
@@ -487,28 +550,23 @@ def test_model_metrics_skipped_with_no_facts() -> None:
         "filters": [],
     }
 
-    model_metrics_payload = {
+    model_payload = {
         "model_metrics": [
             {
                 "name": "Should not be added",
                 "expr": "COUNT(CUSTOMERS.customer_id)",
                 "description": "Not expected.",
             }
-        ]
+        ],
+        "verified_queries": [],
+        "model_description": "This is a customer dimension model.",
     }
 
-    verified_queries_payload = {"verified_queries": []}
-
-    # Model description response for when _summarize_model_description is called
-    model_description_payload = "This is a customer dimension model."
-
     client = _FakeDashscopeClient(
-        [
-            table_payload,
-            model_description_payload,
-            model_metrics_payload,
-            verified_queries_payload,
-        ]
+        {
+            "CUSTOMERS": table_payload,
+            "model": model_payload,
+        }
     )
     session = _FakeSession()
 
@@ -527,3 +585,263 @@ def test_model_metrics_skipped_with_no_facts() -> None:
 
     # Model-level metrics should be skipped because no facts exist
     assert len(model.metrics) == 0
+
+
+def test_cached_client_reuses_responses_across_instances(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def fake_chat_completion(self, messages, max_output_tokens=None):  # type: ignore[no-untyped-def]
+        calls.append(messages)
+        return DashscopeResponse(content='{"ok": true}', request_id="remote")
+
+    monkeypatch.setattr(DashscopeClient, "chat_completion", fake_chat_completion)
+    settings = DashscopeSettings(
+        api_key="key", model="qwen-plus", cache_path=str(tmp_path / "cache.sqlite")
+    )
+    messages = [{"role": "user", "content": "Describe ORDERS"}]
+
+    with CachedDashscopeClient(settings) as client:
+        first = client.chat_completion(messages)
+    with CachedDashscopeClient(settings) as client:
+        second = client.chat_completion(messages)
+        client.chat_completion([{"role": "user", "content": "Describe PAYMENTS"}])
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_cached_client_skips_unparseable_replies_and_scopes_by_endpoint(
+    tmp_path, monkeypatch
+) -> None:
+    replies = iter(["Sorry, I cannot help with that.", '{"ok": true}', '{"ok": 2}'])
+    calls = []
+
+    def fake_chat_completion(self, messages, max_output_tokens=None):  # type: ignore[no-untyped-def]
+        calls.append(self.settings.base_url)
+        return DashscopeResponse(content=next(replies), request_id="remote")
+
+    monkeypatch.setattr(DashscopeClient, "chat_completion", fake_chat_completion)
+    cache_path = str(tmp_path / "cache.sqlite")
+    settings = DashscopeSettings(api_key="key", model="qwen-plus", cache_path=cache_path)
+    other_endpoint = DashscopeSettings(
+        api_key="key",
+        model="qwen-plus",
+        base_url="https://other.example.com",
+        cache_path=cache_path,
+    )
+    messages = [{"role": "user", "content": "Describe ORDERS"}]
+
+    with CachedDashscopeClient(settings) as client:
+        # The non-JSON reply is returned but not replayed on the next call.
+        assert client.chat_completion(messages).content.startswith("Sorry")
+        assert client.chat_completion(messages).content == '{"ok": true}'
+        assert client.chat_completion(messages).content == '{"ok": true}'
+    with CachedDashscopeClient(other_endpoint) as client:
+        assert client.chat_completion(messages).content == '{"ok": 2}'
+
+    assert calls == ["", "", "https://other.example.com"]
+
+
+def test_cached_client_expires_and_bounds_entries(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def fake_chat_completion(self, messages, max_output_tokens=None):  # type: ignore[no-untyped-def]
+        calls.append(messages[0]["content"])
+        return DashscopeResponse(content='{"ok": true}', request_id="remote")
+
+    monkeypatch.setattr(DashscopeClient, "chat_completion", fake_chat_completion)
+    now = [1000.0]
+    monkeypatch.setattr(dashscope_client.time, "time", lambda: now[0])
+    settings = DashscopeSettings(api_key="key", model="qwen-plus")
+
+    with CachedDashscopeClient(settings, ttl_seconds=60, max_entries=2) as client:
+        for content in ("A", "B", "C"):
+            now[0] += 1
+            client.chat_completion([{"role": "user", "content": content}])
+        # Only the two newest rows are kept, so A is fetched again.
+        client.chat_completion([{"role": "user", "content": "C"}])
+        client.chat_completion([{"role": "user", "content": "A"}])
+        assert calls == ["A", "B", "C", "A"]
+
+        now[0] += 61
+        client.chat_completion([{"role": "user", "content": "A"}])
+        assert calls == ["A", "B", "C", "A", "A"]
+
+
+def test_cached_client_prunes_only_past_max_entries(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        DashscopeClient,
+        "chat_completion",
+        lambda self, messages, max_output_tokens=None: DashscopeResponse(
+            content='```json\n{"ok": true}\n```', request_id="remote"
+        ),
+    )
+    prunes = []
+    original_prune = CachedDashscopeClient._prune
+
+    def counting_prune(self, now):  # type: ignore[no-untyped-def]
+        prunes.append(now)
+        original_prune(self, now)
+
+    monkeypatch.setattr(CachedDashscopeClient, "_prune", counting_prune)
+    settings = DashscopeSettings(api_key="key", model="qwen-plus")
+
+    with CachedDashscopeClient(settings, max_entries=3) as client:
+        for content in ("A", "B", "C"):
+            client.chat_completion([{"role": "user", "content": content}])
+        assert prunes == []
+        client.chat_completion([{"role": "user", "content": "D"}])
+        assert len(prunes) == 1
+        rows = client._cache.execute("SELECT COUNT(*) FROM completions").fetchone()
+        assert rows[0] == 3
+
+
+class _RawContentClient:
+    """Serves raw completion strings in call order and records each request."""
+
+    settings = DashscopeSettings(api_key="test", model="test")
+
+    def __init__(self, contents):  # type: ignore[no-untyped-def]
+        self._contents = list(contents)
+        self.calls = []
+
+    def chat_completion(self, messages, max_output_tokens=None):  # type: ignore[no-untyped-def]
+        self.calls.append(
+            ("\n".join(message["content"] for message in messages), max_output_tokens)
+        )
+        return DashscopeResponse(content=self._contents.pop(0), request_id="raw")
+
+
+def test_model_level_payload_falls_back_per_section_on_truncated_response() -> None:
+    client = _RawContentClient(
+        [
+            '{"model_description": "Orders model", "model_metrics": [{"name": "Rev',
+            '{"model_description": "Orders model"}',
+            '{"model_metrics": [{"name": "Revenue", "expr": "SUM(ORDERS.total)"}]}',
+        ]
+    )
+
+    payload = _request_model_level_payload(
+        client,
+        {"tables": [{"name": "ORDERS"}]},
+        "",
+        include_description=True,
+        include_metrics=True,
+        include_verified_queries=False,
+    )
+
+    assert payload == {
+        "model_description": "Orders model",
+        "model_metrics": [{"name": "Revenue", "expr": "SUM(ORDERS.total)"}],
+    }
+    assert len(client.calls) == 3
+    fused, description_only, metrics_only = (prompt for prompt, _ in client.calls)
+    assert "`model_metrics`" in fused and "`model_description`" in fused
+    assert "`model_metrics`" not in description_only
+    assert "`model_description`" not in metrics_only
+    assert all(
+        budget == _MODEL_LEVEL_MAX_OUTPUT_TOKENS for _, budget in client.calls
+    )
+
+
+def test_model_level_payload_only_refetches_missing_sections() -> None:
+    client = _RawContentClient(
+        [
+            '{"model_description": "Orders model", "model_metrics": []}',
+            '{"verified_queries": [{"name": "Top", "sql": "SELECT 1"}]}',
+        ]
+    )
+
+    payload = _request_model_level_payload(
+        client,
+        {"tables": [{"name": "ORDERS"}]},
+        "",
+        include_description=True,
+        include_metrics=True,
+        include_verified_queries=True,
+    )
+
+    assert payload["model_metrics"] == []
+    assert payload["verified_queries"] == [{"name": "Top", "sql": "SELECT 1"}]
+    assert len(client.calls) == 2
+    assert "`model_description`" not in client.calls[1][0]
+
+
+def test_model_level_payload_supports_clients_without_settings() -> None:
+    class _LegacyClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def chat_completion(self, messages):  # type: ignore[no-untyped-def]
+            self.calls += 1
+            return DashscopeResponse(
+                content='{"model_description": "Orders model"}', request_id="legacy"
+            )
+
+    client = _LegacyClient()
+    payload = _request_model_level_payload(
+        client,  # type: ignore[arg-type]
+        {"tables": [{"name": "ORDERS"}]},
+        "",
+        include_description=True,
+        include_metrics=False,
+        include_verified_queries=False,
+    )
+
+    assert payload == {"model_description": "Orders model"}
+    assert client.calls == 1
+
+
+def test_parse_llm_response_accepts_json_that_orjson_rejects() -> None:
+    content = (
+        '```json\n{"model_description": "Orders", "score": NaN, '
+        '"upper": Infinity, "big": 123456789012345678901234567890}\n```'
+    )
+
+    payload = _parse_llm_response(content)
+
+    assert payload is not None
+    assert payload["model_description"] == "Orders"
+    assert payload["score"] != payload["score"]  # NaN
+    assert payload["upper"] == float("inf")
+    assert payload["big"] == 123456789012345678901234567890
+    assert _parse_llm_response('{"model_description": ') is None
+
+
+def test_dashscope_client_parallel_calls_leave_process_state_intact(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("DASHSCOPE_API_BASE", "https://user.example.com/api/v1")
+    monkeypatch.delenv("DASHSCOPE_BASE_URL", raising=False)
+    monkeypatch.delenv("DASHSCOPE_API_KEY", raising=False)
+    global_url = dashscope_client.dashscope.base_http_api_url
+    seen = []
+
+    def fake_call(**kwargs):  # type: ignore[no-untyped-def]
+        time.sleep(0.05)
+        seen.append((kwargs["api_key"], kwargs.get("base_address")))
+        message = SimpleNamespace(content='{"ok": true}')
+        return SimpleNamespace(
+            status_code=HTTPStatus.OK,
+            output=SimpleNamespace(choices=[SimpleNamespace(message=message)]),
+            request_id="remote",
+        )
+
+    monkeypatch.setattr(dashscope_client.Generation, "call", fake_call)
+    client = DashscopeClient(
+        DashscopeSettings(
+            api_key="key", model="qwen-plus", base_url="https://custom.example.com"
+        )
+    )
+    messages = [{"role": "user", "content": "Describe ORDERS"}]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.chat_completion(messages), range(8)))
+
+    assert seen == [("key", "https://custom.example.com/api/v1")] * 8
+    assert os.environ["DASHSCOPE_API_BASE"] == (
+        "https://user.example.com/api/v1"
+    )
+    assert "DASHSCOPE_BASE_URL" not in os.environ
+    assert "DASHSCOPE_API_KEY" not in os.environ
+    assert dashscope_client.dashscope.base_http_api_url == global_url
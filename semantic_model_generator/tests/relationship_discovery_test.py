@@ -1,96 +1,155 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import gc
+import re
+from itertools import chain
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import pandas as pd
 import pytest
 
+from semantic_model_generator.relationships import discovery as discovery_module
 from semantic_model_generator.relationships.discovery import (
+    RelationshipDiscoveryResult,
     discover_relationships_from_schema,
     discover_relationships_from_table_definitions,
+    invalidate_schema_cache,
+)
+from semantic_model_generator.generate_model import (
+    _analyze_composite_key_patterns,
+    _levenshtein_distance,
 )
-from semantic_model_generator.generate_model import _analyze_composite_key_patterns
 
 
-class _FakeResult:
-    def __init__(self, df: pd.DataFrame):
-        self._df = df
+def _fake_result(df: pd.DataFrame) -> SimpleNamespace:
+    return SimpleNamespace(to_pandas=lambda: df)
 
-    def to_pandas(self) -> pd.DataFrame:
-        return self._df.copy()
+
+# Single column of sample values, shared by every _FakeSession. Value sampling
+# only reads it (``tolist`` on the first column), unlike the catalog frame whose
+# columns the connector renames in place.
+_SAMPLE_RESULT = _fake_result(pd.DataFrame({"VALUE": [1, 2, 3]}))
 
 
 class _FakeSession:
+    """
+    Serves canned query results. Kept as a class rather than a SimpleNamespace
+    because discovery's opt-in metadata cache holds sessions as weak dict keys,
+    which needs a hashable object.
+    """
+
+    # Checked in order, paired with the results built in __init__.
+    _QUERY_PATTERNS = (
+        re.compile(r"SHOW CATALOGS", re.IGNORECASE),
+        re.compile(r"INFORMATION_SCHEMA\.COLUMNS", re.IGNORECASE),
+        re.compile(r"FROM INFORMATION_SCHEMA\.TABLES", re.IGNORECASE),
+        re.compile(r"SELECT DISTINCT", re.IGNORECASE),
+    )
+
     def __init__(self, tables: List[str], columns_df: pd.DataFrame):
         self.tables = tables
         self.columns_df = columns_df
+        self.queries: List[str] = []
+        catalog_df = pd.DataFrame(
+            {
+                "CATALOG_NAME": ["CLICKZETTA_SAMPLE_DATA"],
+                "CATEGORY": ["MANAGED"],
+            }
+        )
+        tables_df = pd.DataFrame(
+            {
+                "TABLE_SCHEMA": ["TPCH_100G"] * len(tables),
+                "TABLE_NAME": tables,
+            }
+        )
+        # Each canned result is built once and returned for every matching query.
+        self._routes = tuple(
+            zip(
+                self._QUERY_PATTERNS,
+                (
+                    _fake_result(catalog_df),
+                    _fake_result(columns_df),
+                    _fake_result(tables_df),
+                    _SAMPLE_RESULT,
+                ),
+            )
+        )
 
     def sql(self, query: str):
-        normalized = query.upper()
-        if "SHOW CATALOGS" in normalized:
-            return _FakeResult(
-                pd.DataFrame(
-                    {
-                        "CATALOG_NAME": ["CLICKZETTA_SAMPLE_DATA"],
-                        "CATEGORY": ["MANAGED"],
-                    }
-                )
-            )
-        if "INFORMATION_SCHEMA.COLUMNS" in normalized:
-            return _FakeResult(self.columns_df)
-        if "FROM INFORMATION_SCHEMA.TABLES" in normalized:
-            data = {
-                "TABLE_SCHEMA": ["TPCH_100G"] * len(self.tables),
-                "TABLE_NAME": self.tables,
-            }
-            return _FakeResult(pd.DataFrame(data))
-        if "SELECT DISTINCT" in normalized:
-            # Return single column of sample values
-            return _FakeResult(pd.DataFrame({"VALUE": [1, 2, 3]}))
+        self.queries.append(query)
+        for pattern, result in self._routes:
+            if pattern.search(query):
+                return result
         raise AssertionError(f"Unexpected query: {query}")
 
 
-def _build_columns_df() -> pd.DataFrame:
-    records: List[Dict[str, Any]] = []
-    # Orders table
-    records.extend(
-        [
-            {
-                "TABLE_SCHEMA": "TPCH_100G",
-                "TABLE_NAME": "ORDERS",
-                "COLUMN_NAME": "ORDER_ID",
-                "DATA_TYPE": "NUMBER",
-                "IS_PRIMARY_KEY": True,
-            },
-            {
-                "TABLE_SCHEMA": "TPCH_100G",
-                "TABLE_NAME": "ORDERS",
-                "COLUMN_NAME": "CUSTOMER_ID",
-                "DATA_TYPE": "NUMBER",
-                "IS_PRIMARY_KEY": False,
-            },
-        ]
+def _make_columns_df(
+    table_names: Sequence[str],
+    column_names: Sequence[str],
+    data_types: Sequence[str],
+    is_primary_key: Sequence[bool],
+    schema: str = "TPCH_100G",
+) -> pd.DataFrame:
+    """
+    Builds an INFORMATION_SCHEMA.COLUMNS-shaped frame from parallel column
+    arrays (lists or numpy arrays), so large synthetic schemas stay cheap.
+    """
+    return pd.DataFrame(
+        {
+            "TABLE_SCHEMA": [schema] * len(table_names),
+            "TABLE_NAME": table_names,
+            "COLUMN_NAME": column_names,
+            "DATA_TYPE": data_types,
+            "IS_PRIMARY_KEY": pd.Series(is_primary_key, dtype=bool),
+        }
     )
-    # Customer table
-    records.extend(
-        [
-            {
-                "TABLE_SCHEMA": "TPCH_100G",
-                "TABLE_NAME": "CUSTOMER",
-                "COLUMN_NAME": "CUSTOMER_ID",
-                "DATA_TYPE": "NUMBER",
-                "IS_PRIMARY_KEY": True,
-            },
-            {
-                "TABLE_SCHEMA": "TPCH_100G",
-                "TABLE_NAME": "CUSTOMER",
-                "COLUMN_NAME": "NAME",
-                "DATA_TYPE": "STRING",
-                "IS_PRIMARY_KEY": False,
-            },
-        ]
+
+
+# (column_name, data_type, is_primary_key) per table.
+_ORDERS_COLUMNS = (("ORDER_ID", "NUMBER", True), ("CUSTOMER_ID", "NUMBER", False))
+_CUSTOMER_COLUMNS = (("CUSTOMER_ID", "NUMBER", True), ("NAME", "STRING", False))
+
+_TABLE_NAMES, _COLUMN_NAMES, _DATA_TYPES, _IS_PRIMARY_KEY = zip(
+    *chain.from_iterable(
+        ((table, *column) for column in columns)
+        for table, columns in (
+            ("ORDERS", _ORDERS_COLUMNS),
+            ("CUSTOMER", _CUSTOMER_COLUMNS),
+        )
     )
-    return pd.DataFrame.from_records(records)
+)
+_COLUMNS_DF = _make_columns_df(
+    table_names=_TABLE_NAMES,
+    column_names=_COLUMN_NAMES,
+    data_types=_DATA_TYPES,
+    is_primary_key=_IS_PRIMARY_KEY,
+)
+
+
+def _build_columns_df() -> pd.DataFrame:
+    # The connector normalizes metadata columns in place; a shallow copy keeps
+    # that from touching the shared frame without copying its data.
+    return _COLUMNS_DF.copy(deep=False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schema_cache():
+    # The opt-in column metadata cache is module-global, so each test starts
+    # from an empty one.
+    invalidate_schema_cache()
+    yield
+    invalidate_schema_cache()
 
 
 def test_discover_relationships_from_schema_builds_relationships():
@@ -117,6 +176,105 @@ def test_discover_relationships_from_schema_builds_relationships():
     assert "CUSTOMER" in right_tables
 
 
+def _columns_queries(session: _FakeSession) -> int:
+    return sum(
+        "INFORMATION_SCHEMA.COLUMNS" in query.upper() for query in session.queries
+    )
+
+
+_SCOPE = ("CLICKZETTA_SAMPLE_DATA", "TPCH_100G")
+
+
+def test_schema_column_metadata_is_not_cached_by_default() -> None:
+    session = _FakeSession(["ORDERS", "CUSTOMER"], _build_columns_df())
+
+    for _ in range(2):
+        discover_relationships_from_schema(
+            session=session, workspace=_SCOPE[0], schema=_SCOPE[1]
+        )
+
+    assert _columns_queries(session) == 2
+    assert len(discovery_module._SCHEMA_METADATA_CACHE) == 0
+
+
+def test_uncached_column_metadata_is_handed_out_without_copying(monkeypatch) -> None:
+    fetched = _build_columns_df()
+    monkeypatch.setattr(
+        discovery_module,
+        "get_valid_schemas_tables_columns_df",
+        lambda **_: fetched,
+    )
+
+    session = _FakeSession(["ORDERS", "CUSTOMER"], fetched)
+    assert discovery_module._fetch_columns_df(session, *_SCOPE, None) is fetched
+
+
+def test_schema_column_metadata_cache_is_scoped_to_the_session() -> None:
+    first = _FakeSession(["ORDERS", "CUSTOMER"], _build_columns_df())
+    second = _FakeSession(["ORDERS", "CUSTOMER"], _build_columns_df())
+
+    for session, workspace in (
+        (first, "CLICKZETTA_SAMPLE_DATA"),
+        (first, "clickzetta_sample_data"),
+        (second, "CLICKZETTA_SAMPLE_DATA"),
+    ):
+        discover_relationships_from_schema(
+            session=session,
+            workspace=workspace,
+            schema=_SCOPE[1],
+            metadata_cache_ttl_seconds=60,
+        )
+    # Identifier case is normalized, but another connection never gets a hit.
+    assert _columns_queries(first) == 1
+    assert _columns_queries(second) == 1
+
+    invalidate_schema_cache(first)
+    discover_relationships_from_schema(
+        session=first,
+        workspace=_SCOPE[0],
+        schema=_SCOPE[1],
+        metadata_cache_ttl_seconds=60,
+    )
+    assert _columns_queries(first) == 2
+
+    # Entries are held weakly and disappear with their session.
+    del second, session
+    gc.collect()
+    assert list(discovery_module._SCHEMA_METADATA_CACHE.keys()) == [first]
+
+
+def test_schema_column_metadata_cache_hands_out_copies() -> None:
+    session = _FakeSession(["ORDERS", "CUSTOMER"], _build_columns_df())
+
+    first = discovery_module._fetch_columns_df(session, *_SCOPE, None, 60)
+    first.drop(first.index, inplace=True)
+    second = discovery_module._fetch_columns_df(session, *_SCOPE, None, 60)
+
+    assert len(second) == len(_COLUMNS_DF)
+    assert _columns_queries(session) == 1
+
+
+def test_schema_column_metadata_cache_evicts_expired_and_oldest(monkeypatch) -> None:
+    monkeypatch.setattr(discovery_module, "SCHEMA_METADATA_CACHE_MAX_ENTRIES", 2)
+    now = [0.0]
+    monkeypatch.setattr(discovery_module.time, "monotonic", lambda: now[0])
+    session = _FakeSession(["ORDERS", "CUSTOMER"], _build_columns_df())
+
+    def cached_scopes():  # type: ignore[no-untyped-def]
+        return [key[2] for key in discovery_module._SCHEMA_METADATA_CACHE[session]]
+
+    for tables in (["ORDERS"], ["CUSTOMER"], ["ORDERS", "CUSTOMER"]):
+        now[0] += 1.0
+        discovery_module._fetch_columns_df(session, *_SCOPE, tables, 60)
+    # Bounded: the least recently used scope was dropped.
+    assert cached_scopes() == [("CUSTOMER",), ("ORDERS", "CUSTOMER")]
+
+    # Past the TTL, stale entries are removed rather than merely skipped.
+    now[0] += 60
+    discovery_module._fetch_columns_df(session, *_SCOPE, ["ORDERS"], 60)
+    assert cached_scopes() == [("ORDERS",)]
+
+
 def test_discover_relationships_from_table_definitions_allows_manual_metadata() -> None:
     payload = [
         {
@@ -152,8 +310,27 @@ def test_discover_relationships_from_table_definitions_allows_manual_metadata()
     )
 
 
-def _order_items_orders_products_payload() -> List[Dict[str, Any]]:
-    return [
+def _freeze_payload(
+    payload: Sequence[Mapping[str, Any]]
+) -> Tuple[Mapping[str, Any], ...]:
+    """Read-only view of a table-definition payload (tables and their columns)."""
+    return tuple(
+        MappingProxyType(
+            {
+                **table,
+                "columns": tuple(
+                    MappingProxyType(dict(column)) for column in table["columns"]
+                ),
+            }
+        )
+        for table in payload
+    )
+
+
+# Shared by several tests: discovery only reads table definitions, so the same
+# payload is reused without copying. It is frozen so a mutation fails loudly.
+_ORDER_ITEMS_ORDERS_PRODUCTS_PAYLOAD = _freeze_payload(
+    [
         {
             "table_name": "order_items",
             "columns": [
@@ -177,13 +354,46 @@ def _order_items_orders_products_payload() -> List[Dict[str, Any]]:
             ],
         },
     ]
+)
 
 
-def test_misaligned_id_relationships_are_filtered() -> None:
-    payload = _order_items_orders_products_payload()
+def _freeze_key(value: Any) -> Any:
+    """Hashable stand-in for a (possibly nested) payload, used as a cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_key(item) for item in value)
+    return value
 
-    result = discover_relationships_from_table_definitions(
-        payload,
+
+DiscoverFn = Callable[..., RelationshipDiscoveryResult]
+
+
+@pytest.fixture(scope="session")
+def discover() -> DiscoverFn:
+    """
+    discover_relationships_from_table_definitions memoized on (payload, kwargs),
+    so tests asserting different things about the same run share one result.
+    Results are shared and must be treated as read-only.
+    """
+    cache: Dict[Any, RelationshipDiscoveryResult] = {}
+
+    def call(
+        payload: Sequence[Mapping[str, Any]], **kwargs: Any
+    ) -> RelationshipDiscoveryResult:
+        key = (_freeze_key(payload), tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = discover_relationships_from_table_definitions(
+                payload, **kwargs
+            )
+        return cache[key]
+
+    return call
+
+
+def test_misaligned_id_relationships_are_filtered(discover: DiscoverFn) -> None:
+    result = discover(
+        _ORDER_ITEMS_ORDERS_PRODUCTS_PAYLOAD,
         min_confidence=0.6,
         max_relationships=10,
     )
@@ -203,13 +413,9 @@ def test_misaligned_id_relationships_are_filtered() -> None:
 
 
 
-def test_relationship_discovery_is_order_invariant() -> None:
-    payload = _order_items_orders_products_payload()
-    result_forward = discover_relationships_from_table_definitions(payload)
-
-    result_reversed = discover_relationships_from_table_definitions(
-        list(reversed(payload))
-    )
+def test_relationship_discovery_is_order_invariant(discover: DiscoverFn) -> None:
+    result_forward = discover(_ORDER_ITEMS_ORDERS_PRODUCTS_PAYLOAD)
+    result_reversed = discover(_ORDER_ITEMS_ORDERS_PRODUCTS_PAYLOAD[::-1])
 
     forward_pairs = {(rel.left_table, rel.right_table) for rel in result_forward.relationships}
     reversed_pairs = {(rel.left_table, rel.right_table) for rel in result_reversed.relationships}
@@ -217,32 +423,174 @@ def test_relationship_discovery_is_order_invariant() -> None:
     assert forward_pairs == reversed_pairs
 
 
-def test_discover_relationships_from_table_definitions_filters_generic_ids() -> None:
-    payload = [
-        {
-            "table_name": "table_a",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "value", "type": "NUMBER"},
-            ],
-        },
-        {
-            "table_name": "table_b",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "value", "type": "NUMBER"},
-            ],
-        },
-    ]
-
-    result = discover_relationships_from_table_definitions(
+_GENERIC_ID_TABLES_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "table_name": "table_a",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "value", "type": "NUMBER"},
+        ],
+    },
+    {
+        "table_name": "table_b",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "value", "type": "NUMBER"},
+        ],
+    },
+]
+
+
+_SHARED_ID_WITHOUT_PREFIX_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "table_name": "orders",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "order_date", "type": "DATE"},
+        ],
+    },
+    {
+        "table_name": "products",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "order_reference", "type": "NUMBER"},
+        ],
+    },
+]
+
+
+_SUFFIX_WITHOUT_SEMANTIC_PREFIX_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "table_name": "orders",
+        "columns": [
+            {"name": "order_id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "customer_id", "type": "NUMBER"},
+        ],
+    },
+    {
+        "table_name": "products",
+        "columns": [
+            {"name": "product_id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "order_reference", "type": "STRING"},
+        ],
+    },
+]
+
+
+_CUSTOM_TABLE_NAME_VARIANTS_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "table_name": "entity_alpha",
+        "columns": [
+            {"name": "alpha_id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "alpha_name", "type": "STRING"},
+        ],
+    },
+    {
+        "table_name": "entity_beta",
+        "columns": [
+            {"name": "beta_id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "alpha_id", "type": "NUMBER"},
+        ],
+    },
+]
+
+
+_USERS_POSTS_COMMENTS_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "table_name": "users",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "name", "type": "STRING"},
+        ],
+    },
+    {
+        "table_name": "posts",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "user_id", "type": "NUMBER"},
+            {"name": "title", "type": "STRING"},
+        ],
+    },
+    {
+        "table_name": "comments",
+        "columns": [
+            {"name": "id", "type": "NUMBER", "is_primary_key": True},
+            {"name": "post_id", "type": "NUMBER"},
+            {"name": "user_id", "type": "NUMBER"},
+        ],
+    },
+]
+
+
+_NO_PAIRS: FrozenSet[Tuple[str, str]] = frozenset()
+_EXPECTED_ENTITY_BETA_ALPHA = frozenset({("ENTITY_BETA", "ENTITY_ALPHA")})
+_EXPECTED_POSTS_USERS = frozenset({("POSTS", "USERS")})
+
+
+@pytest.mark.parametrize(
+    "payload, min_confidence, max_relationships, expected_pairs",
+    [
+        pytest.param(_GENERIC_ID_TABLES_PAYLOAD, 0.6, 5, _NO_PAIRS, id="generic_ids"),
+        pytest.param(
+            _SHARED_ID_WITHOUT_PREFIX_PAYLOAD,
+            0.4,
+            5,
+            _NO_PAIRS,
+            id="shared_id_without_prefix",
+        ),
+        pytest.param(
+            _SUFFIX_WITHOUT_SEMANTIC_PREFIX_PAYLOAD,
+            0.6,
+            10,
+            _NO_PAIRS,
+            id="suffix_without_semantic_prefix",
+        ),
+        pytest.param(
+            _CUSTOM_TABLE_NAME_VARIANTS_PAYLOAD,
+            0.5,
+            None,
+            _EXPECTED_ENTITY_BETA_ALPHA,
+            id="custom_table_name_variants",
+        ),
+        pytest.param(
+            _USERS_POSTS_COMMENTS_PAYLOAD,
+            0.6,
+            10,
+            _EXPECTED_POSTS_USERS,
+            id="generic_id_columns_unrelated_tables",
+        ),
+    ],
+)
+def test_table_definitions_relationship_pairs(
+    discover: DiscoverFn,
+    payload: List[Dict[str, Any]],
+    min_confidence: float,
+    max_relationships: Optional[int],
+    expected_pairs: FrozenSet[Tuple[str, str]],
+) -> None:
+    result = discover(
         payload,
+        min_confidence=min_confidence,
+        max_relationships=max_relationships,
+    )
+
+    pairs = frozenset((rel.left_table, rel.right_table) for rel in result.relationships)
+    assert pairs == expected_pairs
+
+
+def test_generic_id_bridge_relationship_is_named_via_comments(
+    discover: DiscoverFn,
+) -> None:
+    # Same run as the generic_id_columns_unrelated_tables pairs case.
+    result = discover(
+        _USERS_POSTS_COMMENTS_PAYLOAD,
         min_confidence=0.6,
-        max_relationships=5,
+        max_relationships=10,
     )
 
-    assert result.summary.total_relationships_found == 0
-    assert not result.relationships
+    # ensure bridge relationship references COMMENTS
+    bridge_names = [rel.name for rel in result.relationships if rel.left_table == "POSTS" and rel.right_table == "USERS"]
+    assert bridge_names and all("_VIA_" in name.upper() for name in bridge_names)
 
 
 def test_table_definitions_support_fully_qualified_names() -> None:
@@ -289,154 +637,44 @@ def test_table_definitions_support_fully_qualified_names() -> None:
     )
 
 
-def test_generic_id_columns_do_not_join_unrelated_tables() -> None:
-    payload = [
-        {
-            "table_name": "users",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "name", "type": "STRING"},
-            ],
-        },
-        {
-            "table_name": "posts",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "user_id", "type": "NUMBER"},
-                {"name": "title", "type": "STRING"},
-            ],
-        },
-        {
-            "table_name": "comments",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "post_id", "type": "NUMBER"},
-                {"name": "user_id", "type": "NUMBER"},
-            ],
-        },
-    ]
-
-    result = discover_relationships_from_table_definitions(
-        payload,
-        min_confidence=0.6,
-        max_relationships=10,
-    )
-
-    pairs = {(rel.left_table, rel.right_table) for rel in result.relationships}
-    assert ("POSTS", "USERS") in pairs
-    assert len(pairs) == 1
-    # ensure bridge relationship references COMMENTS
-    bridge_names = [rel.name for rel in result.relationships if rel.left_table == "POSTS" and rel.right_table == "USERS"]
-    assert bridge_names and all("_VIA_" in name.upper() for name in bridge_names)
-
-
-def test_shared_id_columns_without_prefix_are_rejected() -> None:
-    payload = [
-        {
-            "table_name": "orders",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "order_date", "type": "DATE"},
-            ],
-        },
-        {
-            "table_name": "products",
-            "columns": [
-                {"name": "id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "order_reference", "type": "NUMBER"},
-            ],
-        },
-    ]
-
-    result = discover_relationships_from_table_definitions(
-        payload,
-        min_confidence=0.4,
-        max_relationships=5,
-    )
-
-    pairs = {(rel.left_table, rel.right_table) for rel in result.relationships}
-    assert not pairs  # No relationships expected
-
-
-
-def test_custom_table_name_variants_are_detected() -> None:
-    payload = [
-        {
-            "table_name": "entity_alpha",
-            "columns": [
-                {"name": "alpha_id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "alpha_name", "type": "STRING"},
-            ],
-        },
-        {
-            "table_name": "entity_beta",
-            "columns": [
-                {"name": "beta_id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "alpha_id", "type": "NUMBER"},
-            ],
-        },
-    ]
-
-    result = discover_relationships_from_table_definitions(payload)
-    pairs = {(rel.left_table, rel.right_table) for rel in result.relationships}
-    assert ("ENTITY_BETA", "ENTITY_ALPHA") in pairs
-
-
-
-def test_suffix_match_without_semantic_prefix_is_ignored() -> None:
+def test_discovery_links_entity_key_not_first_same_typed_column() -> None:
+    """
+    C_NATIONKEY must resolve to N_NATIONKEY even though N_REGIONKEY, another
+    same-typed key, is listed first. Integer keys are used because NUMBER is
+    treated as a measure type by candidate generation.
+    """
     payload = [
         {
-            "table_name": "orders",
+            "table_name": "customer",
             "columns": [
-                {"name": "order_id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "customer_id", "type": "NUMBER"},
+                {"name": "c_custkey", "type": "BIGINT", "is_primary_key": True},
+                {"name": "c_nationkey", "type": "BIGINT"},
             ],
         },
         {
-            "table_name": "products",
+            "table_name": "nation",
             "columns": [
-                {"name": "product_id", "type": "NUMBER", "is_primary_key": True},
-                {"name": "order_reference", "type": "STRING"},
+                {"name": "n_regionkey", "type": "BIGINT"},
+                {"name": "n_nationkey", "type": "BIGINT", "is_primary_key": True},
+                {"name": "n_name", "type": "STRING"},
             ],
         },
     ]
 
     result = discover_relationships_from_table_definitions(
-        payload,
-        min_confidence=0.6,
-        max_relationships=10,
+        payload, min_confidence=0.6, max_relationships=10
     )
 
-    pairs = {(rel.left_table, rel.right_table) for rel in result.relationships}
-    assert ("PRODUCTS", "ORDERS") not in pairs
-
-
-def test_dictionary_iteration_order_for_nation_table() -> None:
-    """
-    Test to demonstrate dictionary iteration order issue with NATION table columns.
-
-    This test shows that when we have columns like n_regionkey and n_nationkey,
-    the iteration order can cause n_regionkey to be checked before n_nationkey.
-    If the algorithm uses 'continue' after finding the first valid match,
-    it may select n_regionkey instead of the better match n_nationkey.
-    """
-    # Simulate NATION table with columns in a specific order
-    nation_columns = {
-        "n_nationkey": {"type": "NUMBER", "names": ["N_NATIONKEY"]},
-        "n_name": {"type": "STRING", "names": ["N_NAME"]},
-        "n_regionkey": {"type": "NUMBER", "names": ["N_REGIONKEY"]},
-        "n_comment": {"type": "STRING", "names": ["N_COMMENT"]},
+    pairs = {
+        (rel.left_table, rel.right_table): [
+            (key.left_column, key.right_column) for key in rel.relationship_columns
+        ]
+        for rel in result.relationships
     }
-
-    # Test iteration order
-    iteration_order = list(nation_columns.keys())
-    print(f"Dictionary iteration order: {iteration_order}")
-
-    # In Python 3.7+, dictionaries maintain insertion order
-    # So the iteration order should be: n_nationkey, n_name, n_regionkey, n_comment
-    assert iteration_order == ["n_nationkey", "n_name", "n_regionkey", "n_comment"]
+    assert pairs == {("CUSTOMER", "NATION"): [("C_NATIONKEY", "N_NATIONKEY")]}
 
 
+@pytest.mark.slow
 def test_relationship_discovery_selects_best_match_not_first_match() -> None:
     """
     Test that relationship discovery selects the best matching column,
@@ -489,14 +727,10 @@ def test_relationship_discovery_selects_best_match_not_first_match() -> None:
         )
 
 
-def test_composite_pk_analysis_uses_correct_column_side() -> None:
-    """
-    Regression: ensure composite key analysis counts PK coverage on the correct table side.
-
-    Before the fix, the right-side table always inspected column_pairs[0], producing zero
-    coverage and causing legitimate composite relationships to be dropped.
-    """
-    table_meta = {
+@pytest.fixture(scope="module")
+def composite_table_meta() -> Dict[str, Any]:
+    """Two-column composite PK table; _analyze_composite_key_patterns only reads it."""
+    return {
         "columns": {
             "order_id": {"names": ["ORDER_ID"], "base_type": "NUMBER"},
             "line_id": {"names": ["LINE_ID"], "base_type": "NUMBER"},
@@ -506,18 +740,36 @@ def test_composite_pk_analysis_uses_correct_column_side() -> None:
             "line_id": ["LINE_ID"],
         },
     }
+
+
+def test_composite_pk_analysis_uses_correct_column_side(
+    composite_table_meta: Dict[str, Any],
+) -> None:
+    """
+    Regression: ensure composite key analysis counts PK coverage on the correct table side.
+
+    Before the fix, the right-side table always inspected column_pairs[0], producing zero
+    coverage and causing legitimate composite relationships to be dropped.
+    """
     column_pairs = [
         ("L_ORDER_ID", "ORDER_ID"),
         ("L_LINE_ID", "LINE_ID"),
     ]
 
     analysis = _analyze_composite_key_patterns(
-        table_meta,
+        composite_table_meta,
         column_pairs,
         column_index=1,
     )
 
     # Both PK columns should be detected, yielding full coverage.
     assert analysis["pk_column_count"] == 2
-    assert analysis["pk_coverage_ratio"] == pytest.approx(1.0)
+    # 2 / 2 is exact in floating point, so no tolerance is needed.
+    assert analysis["pk_coverage_ratio"] == 1.0
     assert analysis["is_composite_pk"]
+
+
+def test_edit_distance_counts_adjacent_transposition_once() -> None:
+    assert _levenshtein_distance("CUSTOMRE", "CUSTOMER") == 1
+    assert _levenshtein_distance("kitten", "sitting") == 3
+    assert _levenshtein_distance("", "ORDER") == 5
@@ -1,20 +1,29 @@
 import pytest
 
-from semantic_model_generator.clickzetta_utils.utils import create_fqn_table
 from semantic_model_generator.data_processing.data_types import FQNParts
 
+# ``clickzetta_utils.utils`` pulls in the zettapark session stack at import
+# time, so it is imported inside the tests rather than at collection.
 
-def test_fqn_creation():
-    input_name = "database.schema.table"
 
-    fqn_parts = create_fqn_table(input_name)
+@pytest.mark.parametrize(
+    "input_name, expected",
+    [
+        (
+            "database.schema.table",
+            FQNParts(database="DATABASE", schema_name="SCHEMA", table="table"),
+        ),
+    ],
+)
+def test_fqn_creation(input_name: str, expected: FQNParts) -> None:
+    from semantic_model_generator.clickzetta_utils.utils import create_fqn_table
 
-    assert fqn_parts == FQNParts(
-        database="DATABASE", schema_name="SCHEMA", table="table"
-    )
+    assert create_fqn_table(input_name) == expected
 
 
 def test_fqn_creation_invalid_name():
+    from semantic_model_generator.clickzetta_utils.utils import create_fqn_table
+
     input_name = "database.schema table"
     with pytest.raises(ValueError):
         create_fqn_table(input_name)